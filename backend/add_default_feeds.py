@@ -92,40 +92,44 @@ try:
     user_id = user[0]
     print(f"✅ Found admin user (ID: {user_id})")
 
-    added_count = 0
-    skipped_count = 0
-
-    for feed_data in DEFAULT_FEEDS:
-        # Check if feed already exists
-        result = db.execute(
-            text("SELECT id FROM feeds WHERE user_id = :uid AND url = :url"),
-            {"uid": user_id, "url": feed_data["url"]}
-        )
-        existing = result.fetchone()
-
-        if existing:
-            print(f"⏭️  Skipped (already exists): {feed_data['title']}")
-            skipped_count += 1
-            continue
-
-        # Add feed
-        db.execute(
-            text("""
-                INSERT INTO feeds (user_id, url, title, description, is_active)
-                VALUES (:uid, :url, :title, :desc, 1)
-            """),
+    before = db.execute(
+        text("SELECT count(*) FROM feeds WHERE user_id = :uid"), {"uid": user_id}
+    ).scalar()
+
+    # One batched INSERT instead of a SELECT + INSERT round-trip per feed;
+    # duplicates are dropped DB-side by the unique constraint
+    if engine.dialect.name == "sqlite":
+        insert_stmt = text("""
+            INSERT OR IGNORE INTO feeds (user_id, url, title, description, is_active)
+            VALUES (:uid, :url, :title, :desc, 1)
+        """)
+    else:
+        insert_stmt = text("""
+            INSERT INTO feeds (user_id, url, title, description, is_active)
+            VALUES (:uid, :url, :title, :desc, 1)
+            ON CONFLICT (user_id, url) DO NOTHING
+        """)
+
+    db.execute(
+        insert_stmt,
+        [
             {
                 "uid": user_id,
                 "url": feed_data["url"],
                 "title": feed_data["title"],
-                "desc": feed_data["description"]
+                "desc": feed_data["description"],
             }
-        )
-        print(f"✅ Added: {feed_data['title']}")
-        added_count += 1
-
+            for feed_data in DEFAULT_FEEDS
+        ],
+    )
     db.commit()
 
+    after = db.execute(
+        text("SELECT count(*) FROM feeds WHERE user_id = :uid"), {"uid": user_id}
+    ).scalar()
+    added_count = after - before
+    skipped_count = len(DEFAULT_FEEDS) - added_count
+
     print("\n" + "="*60)
     print(f"✅ Default feeds setup complete!")
     print(f"   Added: {added_count} feeds")
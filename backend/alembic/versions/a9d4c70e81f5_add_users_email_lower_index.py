@@ -0,0 +1,30 @@
+"""Add functional lower(email) index on users
+
+Revision ID: a9d4c70e81f5
+Revises: f2a61d94c3b8
+Create Date: 2026-08-27 13:21:40.518392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4c70e81f5'
+down_revision: Union[str, None] = 'f2a61d94c3b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_email_lower',
+        'users',
+        [sa.text('lower(email)')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_lower', table_name='users')
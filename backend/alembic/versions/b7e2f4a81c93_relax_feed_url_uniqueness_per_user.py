@@ -0,0 +1,29 @@
+"""Relax feeds.url uniqueness to per-user
+
+Revision ID: b7e2f4a81c93
+Revises: a9d4c70e81f5
+Create Date: 2026-08-27 14:05:12.837265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2f4a81c93'
+down_revision: Union[str, None] = 'a9d4c70e81f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_feeds_url', table_name='feeds')
+    op.create_index('ix_feeds_url', 'feeds', ['url'], unique=False)
+    op.create_index('uq_feeds_user_id_url', 'feeds', ['user_id', 'url'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_feeds_user_id_url', table_name='feeds')
+    op.drop_index('ix_feeds_url', table_name='feeds')
+    op.create_index('ix_feeds_url', 'feeds', ['url'], unique=True)
@@ -0,0 +1,70 @@
+"""Add article_insights and article_factchecks persistence tables
+
+Revision ID: b8a4e6f3d215
+Revises: e3b7d92a54c1
+Create Date: 2026-08-27 18:02:37.554910
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8a4e6f3d215'
+down_revision: Union[str, None] = 'e3b7d92a54c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'article_insights',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.Column('model', sa.String(), nullable=False),
+        sa.Column('content_hash', sa.String(length=32), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uq_article_insights_article_model_hash',
+        'article_insights',
+        ['article_id', 'model', 'content_hash'],
+        unique=True,
+    )
+    op.create_table(
+        'article_factchecks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.Column('model', sa.String(), nullable=False),
+        sa.Column('content_hash', sa.String(length=32), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uq_article_factchecks_article_model_hash',
+        'article_factchecks',
+        ['article_id', 'model', 'content_hash'],
+        unique=True,
+    )
+    # SQLite keeps the JSON-encoded TEXT payloads; only PostgreSQL gets JSONB
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "ALTER TABLE article_insights ALTER COLUMN payload TYPE jsonb USING payload::jsonb"
+    )
+    op.execute(
+        "ALTER TABLE article_factchecks ALTER COLUMN payload TYPE jsonb USING payload::jsonb"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_article_factchecks_article_model_hash', table_name='article_factchecks')
+    op.drop_table('article_factchecks')
+    op.drop_index('uq_article_insights_article_model_hash', table_name='article_insights')
+    op.drop_table('article_insights')
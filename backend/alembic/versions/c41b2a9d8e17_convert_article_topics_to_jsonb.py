@@ -0,0 +1,33 @@
+"""Convert article topics to JSONB with a GIN index
+
+Revision ID: c41b2a9d8e17
+Revises: 9a0f477a0322
+Create Date: 2026-08-27 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41b2a9d8e17'
+down_revision: Union[str, None] = '9a0f477a0322'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite keeps the JSON-encoded TEXT column; only PostgreSQL gets JSONB + GIN
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE articles ALTER COLUMN topics TYPE jsonb USING topics::jsonb")
+    op.execute(
+        "CREATE INDEX ix_articles_topics_gin ON articles USING gin (topics jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX ix_articles_topics_gin")
+    op.execute("ALTER TABLE articles ALTER COLUMN topics TYPE text USING topics::text")
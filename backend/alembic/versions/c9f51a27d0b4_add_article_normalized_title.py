@@ -0,0 +1,27 @@
+"""Add precomputed normalized_title column to articles
+
+Revision ID: c9f51a27d0b4
+Revises: d4c83b61e9a7
+Create Date: 2026-08-27 16:05:11.732548
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9f51a27d0b4'
+down_revision: Union[str, None] = 'd4c83b61e9a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows stay NULL; the fuzzy matcher normalizes them on the fly
+    # and new rows are populated at ingest
+    op.add_column('articles', sa.Column('normalized_title', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('articles', 'normalized_title')
@@ -0,0 +1,45 @@
+"""Convert user preference list columns to JSONB
+
+Revision ID: d4c83b61e9a7
+Revises: b7e2f4a81c93
+Create Date: 2026-08-27 14:32:28.904171
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4c83b61e9a7'
+down_revision: Union[str, None] = 'b7e2f4a81c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIST_COLUMNS = (
+    'preferred_topics',
+    'excluded_topics',
+    'preferred_sources',
+    'excluded_sources',
+    'excluded_words',
+)
+
+
+def upgrade() -> None:
+    # SQLite keeps the JSON-encoded TEXT columns; only PostgreSQL gets JSONB
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in LIST_COLUMNS:
+        op.execute(
+            f"ALTER TABLE user_preferences ALTER COLUMN {column} "
+            f"TYPE jsonb USING {column}::jsonb"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in LIST_COLUMNS:
+        op.execute(
+            f"ALTER TABLE user_preferences ALTER COLUMN {column} "
+            f"TYPE text USING {column}::text"
+        )
@@ -0,0 +1,27 @@
+"""Add title_simhash column to articles for duplicate prefiltering
+
+Revision ID: e3b7d92a54c1
+Revises: c9f51a27d0b4
+Create Date: 2026-08-27 17:41:08.219344
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b7d92a54c1'
+down_revision: Union[str, None] = 'c9f51a27d0b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows stay NULL and bypass the prefilter; new rows are
+    # populated at ingest (see fuzzy_matcher.simhash64)
+    op.add_column('articles', sa.Column('title_simhash', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('articles', 'title_simhash')
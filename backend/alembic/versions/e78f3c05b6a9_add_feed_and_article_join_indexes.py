@@ -0,0 +1,31 @@
+"""Add feed user_id and article (feed_id, published_date) indexes
+
+Revision ID: e78f3c05b6a9
+Revises: c41b2a9d8e17
+Create Date: 2026-08-27 10:41:17.530982
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e78f3c05b6a9'
+down_revision: Union[str, None] = 'c41b2a9d8e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_feeds_user_id'), 'feeds', ['user_id'], unique=False)
+    op.create_index(
+        'ix_articles_feed_id_published_date',
+        'articles',
+        ['feed_id', 'published_date'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_articles_feed_id_published_date', table_name='articles')
+    op.drop_index(op.f('ix_feeds_user_id'), table_name='feeds')
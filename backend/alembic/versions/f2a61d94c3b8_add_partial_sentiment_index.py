@@ -0,0 +1,32 @@
+"""Add partial index on articles sentiment_score
+
+Revision ID: f2a61d94c3b8
+Revises: e78f3c05b6a9
+Create Date: 2026-08-27 11:02:55.274816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a61d94c3b8'
+down_revision: Union[str, None] = 'e78f3c05b6a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_articles_feed_id_sentiment_score',
+        'articles',
+        ['feed_id', 'sentiment_score'],
+        unique=False,
+        postgresql_where=sa.text('sentiment_score IS NOT NULL'),
+        sqlite_where=sa.text('sentiment_score IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_articles_feed_id_sentiment_score', table_name='articles')
@@ -0,0 +1,27 @@
+"""Add raw float32 embedding_blob column to articles
+
+Revision ID: f6d2a84c1b97
+Revises: b8a4e6f3d215
+Create Date: 2026-08-27 19:14:08.221563
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6d2a84c1b97'
+down_revision: Union[str, None] = 'b8a4e6f3d215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Raw float32 bytes of the embedding; existing rows keep NULL and the
+    # readers fall back to parsing the JSON text column
+    op.add_column('articles', sa.Column('embedding_blob', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('articles', 'embedding_blob')
@@ -1,15 +1,20 @@
 """Article endpoints."""
 
+import hashlib
 import json
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import Integer, case, cast, func, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer
 
 from app.api.deps import get_current_active_user
 from app.core.config import settings
-from app.db.base import get_db
-from app.models.feed import Article
+from app.db.base import get_async_db, get_db
+from app.models.feed import Article, Feed
 from app.models.user import User
+from app.schemas import from_orm_fast
 from app.schemas.feed import Article as ArticleSchema
 from app.schemas.feed import ArticleLLMInsights, ArticleWithRecommendation
 from app.services.llm_insights import LLMContentError, LLMFeatureDisabledError, LLMInsightService
@@ -18,10 +23,101 @@ from app.services.recommendation_engine import RecommendationEngine
 
 router = APIRouter()
 
+# Analytics recompute only when feeds re-fetch, so a short cache window is safe
+_ANALYTICS_CACHE_TTL = 120
+
+
+async def _cached_analytics(request: Request, response: Response, key: str, compute):
+    """Serve an analytics payload through the Redis cache with ETag revalidation.
+
+    The JSON-serialized payload is cached under ``key`` for a short TTL; its
+    hash doubles as the ETag so polling clients get 304s instead of a body.
+    Falls through to ``compute`` (and plain 200s) when Redis is unavailable.
+    """
+    from app.core.cache import cache_get, cache_set
+
+    raw = await cache_get(key)
+    if raw is None:
+        payload = await compute()
+        raw = json.dumps(payload)
+        await cache_set(key, raw, _ANALYTICS_CACHE_TTL)
+    else:
+        payload = json.loads(raw)
+
+    etag = f'"{hashlib.md5(raw.encode()).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
+    return payload
+
+
+def _user_articles(db: Session, user_id: int):
+    """Base query for articles in the user's feeds.
+
+    Uses an explicit JOIN on feeds instead of feed.has(), which emitted a
+    correlated EXISTS subquery on top of the join.
+    """
+    return db.query(Article).join(Feed, Article.feed_id == Feed.id).filter(Feed.user_id == user_id)
+
+
+def _user_article_stmt(user_id: int, article_id: int):
+    """Cached lambda statement selecting one of the user's articles.
+
+    lambda_stmt memoizes the compiled SQL for this hot lookup, so repeat
+    requests skip ORM statement construction; the closed-over ids become
+    bound parameters. Usable from both sync and async sessions.
+    """
+    return lambda_stmt(
+        lambda: select(Article)
+        .join(Feed, Article.feed_id == Feed.id)
+        .where(Article.id == article_id, Feed.user_id == user_id)
+    )
+
+
+def _get_user_article(db: Session, user_id: int, article_id: int) -> Article | None:
+    """Fetch one of the user's articles through a sync session."""
+    return db.execute(_user_article_stmt(user_id, article_id)).scalar_one_or_none()
+
+
+def _update_user_article(db: Session, user_id: int, article_id: int, **values):
+    """Apply a single index-targeted UPDATE ... RETURNING to a user's article.
+
+    One round-trip instead of SELECT, mutate, commit, refresh; returns the
+    updated row, or None when the article does not belong to the user.
+    """
+    stmt = (
+        update(Article)
+        .where(
+            Article.id == article_id,
+            Article.feed_id.in_(select(Feed.id).where(Feed.user_id == user_id)),
+        )
+        .values(**values)
+        .returning(*Article.__table__.columns)
+    )
+    row = db.execute(stmt).one_or_none()
+    if row is not None:
+        db.commit()
+    return row
+
+
+def _topic_filter(topic: str):
+    """Build a dialect-appropriate predicate matching articles tagged with a topic.
+
+    On PostgreSQL the topics column is JSONB, so containment (@>) can use the
+    GIN index; elsewhere fall back to the JSON substring match.
+    """
+    from app.db.base import engine
+
+    if engine.dialect.name == "postgresql":
+        return Article.topics.op("@>")(cast(json.dumps([topic]), JSONB))
+    return Article.topics.like(f'%"{topic}"%')
+
 
 @router.get("/", response_model=list[ArticleSchema])
-def list_articles(
-    db: Session = Depends(get_db),
+async def list_articles(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
     skip: int = 0,
     limit: int = 50,
@@ -31,50 +127,93 @@ def list_articles(
     min_sentiment: float | None = None,
     max_sentiment: float | None = None,
     sort_by: str = "date",  # date, sentiment
-) -> list[Article]:
+) -> list[Article] | Response:
     """List user's articles with optional filtering."""
+    from datetime import timezone
+    from email.utils import format_datetime
+
     from app.models.feed import UserPreference
 
-    query = db.query(Article).join(Article.feed).filter(Article.feed.has(user_id=current_user.id))
+    # Preferences are needed both for the word filter and the change detector
+    prefs = (
+        await db.execute(select(UserPreference).where(UserPreference.user_id == current_user.id))
+    ).scalar_one_or_none()
+    excluded_words: list[str] = prefs.excluded_words if prefs and prefs.excluded_words else []
+
+    # Cheap change detector for the polling UI: a few aggregates over the
+    # user's articles stand in for a version number, so an unchanged client
+    # copy is answered with 304 before the main query runs. The non-null
+    # counts of sentiment_score and cluster_id move when NLP enrichment fills
+    # rows in, so processed articles invalidate held ETags too
+    version_row = (
+        await db.execute(
+            select(
+                func.count(Article.id),
+                func.max(Article.created_at),
+                func.sum(cast(Article.is_read, Integer)),
+                func.sum(cast(Article.is_bookmarked, Integer)),
+                func.sum(Article.user_rating),
+                func.count(Article.sentiment_score),
+                func.count(Article.cluster_id),
+            )
+            .join(Feed, Article.feed_id == Feed.id)
+            .where(Feed.user_id == current_user.id)
+        )
+    ).one()
+    etag_source = f"{tuple(version_row)}:{sorted(excluded_words)}:{request.url.query}"
+    etag = f'"{hashlib.md5(etag_source.encode()).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
+    last_created = version_row[1]
+    if last_created is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            last_created.replace(tzinfo=timezone.utc), usegmt=True
+        )
+
+    # Skip hydrating the embedding JSON blob; the schema never serializes it
+    stmt = (
+        select(Article)
+        .join(Feed, Article.feed_id == Feed.id)
+        .where(Feed.user_id == current_user.id)
+        .options(defer(Article.embedding))
+    )
 
     if unread_only:
-        query = query.filter(Article.is_read.is_(False))
+        stmt = stmt.where(Article.is_read.is_(False))
 
     if bookmarked_only:
-        query = query.filter(Article.is_bookmarked.is_(True))
+        stmt = stmt.where(Article.is_bookmarked.is_(True))
 
     # Sentiment filtering
     if min_sentiment is not None:
-        query = query.filter(Article.sentiment_score >= min_sentiment)
+        stmt = stmt.where(Article.sentiment_score >= min_sentiment)
 
     if max_sentiment is not None:
-        query = query.filter(Article.sentiment_score <= max_sentiment)
+        stmt = stmt.where(Article.sentiment_score <= max_sentiment)
 
-    # Topic filtering (check if topic JSON contains the string)
+    # Topic filtering
     if topic:
-        query = query.filter(Article.topics.like(f'%"{topic}"%'))
+        stmt = stmt.where(_topic_filter(topic))
+
+    # Word filter from user preferences, pushed into SQL so pagination stays intact;
+    # lowering into a set first drops duplicate terms and their predicates
+    if excluded_words:
+        searchable = func.lower(Article.title + " " + func.coalesce(Article.description, ""))
+        for word in {w.lower() for w in excluded_words}:
+            escaped = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            stmt = stmt.where(searchable.notlike(f"%{escaped}%", escape="\\"))
 
     # Sorting
     if sort_by == "sentiment":
-        query = query.filter(Article.sentiment_score.isnot(None)).order_by(
+        stmt = stmt.where(Article.sentiment_score.isnot(None)).order_by(
             Article.sentiment_score.desc()
         )
     else:  # default to date
-        query = query.order_by(Article.published_date.desc())
-
-    articles = query.offset(skip).limit(limit).all()
-
-    # Apply word filter from user preferences
-    prefs = db.query(UserPreference).filter(UserPreference.user_id == current_user.id).first()
-    if prefs and prefs.excluded_words:
-        filtered_articles = []
-        for article in articles:
-            text = f"{article.title} {article.description or ''}".lower()
-            if not any(word.lower() in text for word in prefs.excluded_words):
-                filtered_articles.append(article)
-        return filtered_articles
+        stmt = stmt.order_by(Article.published_date.desc())
 
-    return articles
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    return list(result.scalars().all())
 
 
 @router.get("/recommendations", response_model=list[ArticleWithRecommendation])
@@ -89,27 +228,24 @@ async def get_recommendations(
 
     result = []
     for article, score, reason in recommendations:
-        article_dict = ArticleSchema.model_validate(article).model_dump()
+        # Trusted ORM rows: construct the schema without re-validation
+        article_dict = from_orm_fast(ArticleSchema, article).model_dump()
         article_dict["recommendation_score"] = score
         article_dict["recommendation_reason"] = reason
-        result.append(ArticleWithRecommendation(**article_dict))
+        result.append(ArticleWithRecommendation.model_construct(**article_dict))
 
     return result
 
 
 @router.get("/{article_id}", response_model=ArticleSchema)
-def get_article(
+async def get_article(
     article_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Article:
     """Get article by ID."""
-    article = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.id == article_id, Article.feed.has(user_id=current_user.id))
-        .first()
-    )
+    result = await db.execute(_user_article_stmt(current_user.id, article_id))
+    article = result.scalar_one_or_none()
 
     if not article:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
@@ -118,9 +254,9 @@ def get_article(
 
 
 @router.get("/{article_id}/llm-insights", response_model=ArticleLLMInsights)
-def get_article_llm_insights(
+async def get_article_llm_insights(
     article_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ) -> ArticleLLMInsights:
     """Get AI-generated insights for a specific article."""
@@ -129,19 +265,15 @@ def get_article_llm_insights(
             status_code=status.HTTP_403_FORBIDDEN, detail="LLM features are disabled"
         )
 
-    article = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.id == article_id, Article.feed.has(user_id=current_user.id))
-        .first()
-    )
+    result = await db.execute(_user_article_stmt(current_user.id, article_id))
+    article = result.scalar_one_or_none()
 
     if not article:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
 
     service = LLMInsightService()
     try:
-        payload = service.generate_insights(article)
+        payload = await service.generate_insights(article, db=db)
     except LLMFeatureDisabledError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
     except LLMContentError as exc:
@@ -157,20 +289,11 @@ def mark_as_read(
     current_user: User = Depends(get_current_active_user),
 ) -> Article:
     """Mark article as read."""
-    article = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.id == article_id, Article.feed.has(user_id=current_user.id))
-        .first()
-    )
+    article = _update_user_article(db, current_user.id, article_id, is_read=True)
 
-    if not article:
+    if article is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
 
-    article.is_read = True
-    db.commit()
-    db.refresh(article)
-
     return article
 
 
@@ -181,20 +304,13 @@ def toggle_bookmark(
     current_user: User = Depends(get_current_active_user),
 ) -> Article:
     """Toggle article bookmark status."""
-    article = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.id == article_id, Article.feed.has(user_id=current_user.id))
-        .first()
+    article = _update_user_article(
+        db, current_user.id, article_id, is_bookmarked=~Article.is_bookmarked
     )
 
-    if not article:
+    if article is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
 
-    article.is_bookmarked = not article.is_bookmarked
-    db.commit()
-    db.refresh(article)
-
     return article
 
 
@@ -212,20 +328,11 @@ def rate_article(
             detail="Rating must be between 0.0 and 5.0",
         )
 
-    article = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.id == article_id, Article.feed.has(user_id=current_user.id))
-        .first()
-    )
+    article = _update_user_article(db, current_user.id, article_id, user_rating=rating)
 
-    if not article:
+    if article is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
 
-    article.user_rating = rating
-    db.commit()
-    db.refresh(article)
-
     return article
 
 
@@ -236,12 +343,7 @@ def process_article(
     current_user: User = Depends(get_current_active_user),
 ) -> Article:
     """Process article with NLP (generate embeddings, topics, etc.)."""
-    article = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.id == article_id, Article.feed.has(user_id=current_user.id))
-        .first()
-    )
+    article = _get_user_article(db, current_user.id, article_id)
 
     if not article:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
@@ -285,12 +387,7 @@ def get_similar_articles(
     limit: int = 10,
 ) -> list[Article]:
     """Get similar articles based on content similarity."""
-    article = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.id == article_id, Article.feed.has(user_id=current_user.id))
-        .first()
-    )
+    article = _get_user_article(db, current_user.id, article_id)
 
     if not article:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
@@ -302,177 +399,212 @@ def get_similar_articles(
 
 
 @router.get("/topics/all", response_model=dict[str, int])
-def get_all_topics(
-    db: Session = Depends(get_db),
+async def get_all_topics(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ) -> dict[str, int]:
     """Get all topics with article counts."""
-    articles = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.feed.has(user_id=current_user.id), Article.topics.isnot(None))
-        .all()
-    )
+    from collections import Counter
+
+    async def compute() -> dict[str, int]:
+        # Topics are packed JSON, so unpacking stays in Python; only pull the one column
+        rows = await db.execute(
+            select(Article.topics)
+            .join(Feed, Article.feed_id == Feed.id)
+            .where(Feed.user_id == current_user.id, Article.topics.isnot(None))
+        )
 
-    topic_counts: dict[str, int] = {}
-    for article in articles:
-        if article.topics:
-            for topic in article.topics:
-                topic_counts[topic] = topic_counts.get(topic, 0) + 1
+        topic_counts: Counter[str] = Counter()
+        for (topics,) in rows:
+            if topics:
+                topic_counts.update(topics)
 
-    # Sort by count descending
-    sorted_topics = dict(sorted(topic_counts.items(), key=lambda x: x[1], reverse=True))
+        # most_common() already sorts by count descending
+        return dict(topic_counts.most_common())
 
-    return sorted_topics
+    return await _cached_analytics(
+        request, response, f"analytics:topics-all:{current_user.id}", compute
+    )
 
 
 @router.get("/analytics/sentiment", response_model=dict[str, int | dict[str, int]])
-def get_sentiment_analytics(
-    db: Session = Depends(get_db),
+async def get_sentiment_analytics(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ) -> dict[str, int | dict[str, int]]:
     """Get sentiment distribution and trends over time."""
-    articles = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.feed.has(user_id=current_user.id), Article.sentiment_score.isnot(None))
-        .all()
-    )
-
-    sentiment_counts = {
-        "positive": 0,
-        "slightly_positive": 0,
-        "neutral": 0,
-        "slightly_negative": 0,
-        "negative": 0,
-        "total": len(articles),
-    }
-
-    # Daily sentiment trends (last 7 days)
     from collections import defaultdict
     from datetime import datetime, timedelta
 
-    daily_sentiment: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"positive": 0, "neutral": 0, "negative": 0}
-    )
+    async def compute() -> dict[str, int | dict[str, int]]:
+        # Bucket the histogram in SQL so only one row per bucket crosses the wire
+        bucket = case(
+            (Article.sentiment_score >= 0.5, "positive"),
+            (Article.sentiment_score >= 0.05, "slightly_positive"),
+            (Article.sentiment_score <= -0.5, "negative"),
+            (Article.sentiment_score <= -0.05, "slightly_negative"),
+            else_="neutral",
+        )
+        bucket_rows = await db.execute(
+            select(bucket, func.count(Article.id))
+            .join(Feed, Article.feed_id == Feed.id)
+            .where(Feed.user_id == current_user.id, Article.sentiment_score.isnot(None))
+            .group_by(bucket)
+        )
+
+        sentiment_counts = {
+            "positive": 0,
+            "slightly_positive": 0,
+            "neutral": 0,
+            "slightly_negative": 0,
+            "negative": 0,
+        }
+        for name, count in bucket_rows:
+            sentiment_counts[name] = count
+        sentiment_counts["total"] = sum(sentiment_counts.values())
+
+        # Daily sentiment trends (last 7 days), bucketed and dated in SQL
+        daily_sentiment: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"positive": 0, "neutral": 0, "negative": 0}
+        )
 
-    for article in articles:
-        score = article.sentiment_score
-
-        # Categorize sentiment
-        if score >= 0.5:
-            sentiment_counts["positive"] += 1
-        elif score >= 0.05:
-            sentiment_counts["slightly_positive"] += 1
-        elif score <= -0.5:
-            sentiment_counts["negative"] += 1
-        elif score <= -0.05:
-            sentiment_counts["slightly_negative"] += 1
-        else:
-            sentiment_counts["neutral"] += 1
-
-        # Daily trends
-        if article.published_date:
-            date_key = article.published_date.strftime("%Y-%m-%d")
-            if score >= 0.05:
-                daily_sentiment[date_key]["positive"] += 1
-            elif score <= -0.05:
-                daily_sentiment[date_key]["negative"] += 1
-            else:
-                daily_sentiment[date_key]["neutral"] += 1
-
-    # Convert defaultdict to regular dict
-    sentiment_counts["daily_trends"] = dict(daily_sentiment)
-
-    return sentiment_counts
+        day = func.date(Article.published_date)
+        trend_bucket = case(
+            (Article.sentiment_score >= 0.05, "positive"),
+            (Article.sentiment_score <= -0.05, "negative"),
+            else_="neutral",
+        )
+        cutoff_date = datetime.utcnow() - timedelta(days=7)
+        daily_rows = await db.execute(
+            select(day, trend_bucket, func.count(Article.id))
+            .join(Feed, Article.feed_id == Feed.id)
+            .where(
+                Feed.user_id == current_user.id,
+                Article.sentiment_score.isnot(None),
+                Article.published_date >= cutoff_date,
+            )
+            .group_by(day, trend_bucket)
+        )
+        for date_key, name, count in daily_rows:
+            daily_sentiment[str(date_key)][name] = count
+
+        # Convert defaultdict to regular dict
+        sentiment_counts["daily_trends"] = dict(daily_sentiment)
+
+        return sentiment_counts
+
+    return await _cached_analytics(
+        request, response, f"analytics:sentiment:{current_user.id}", compute
+    )
 
 
 @router.get("/analytics/topics", response_model=dict[str, list[dict[str, str | int]]])
-def get_topic_trends(
-    db: Session = Depends(get_db),
+async def get_topic_trends(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
     days: int = 7,
 ) -> dict[str, list[dict[str, str | int]]]:
     """Get topic trends over time."""
     from datetime import datetime, timedelta
 
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-    articles = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(
-            Article.feed.has(user_id=current_user.id),
-            Article.topics.isnot(None),
-            Article.published_date >= cutoff_date,
-        )
-        .all()
-    )
-
-    # Track topics over time
-    topic_timeline: dict[str, list[str]] = {}
-
-    for article in articles:
-        if article.topics and article.published_date:
-            date_key = article.published_date.strftime("%Y-%m-%d")
-            for topic in article.topics[:5]:  # Top 5 topics per article
-                if topic not in topic_timeline:
-                    topic_timeline[topic] = []
-                topic_timeline[topic].append(date_key)
-
-    # Calculate trending topics
-    trending: list[dict[str, str | int]] = []
-    for topic, dates in topic_timeline.items():
-        trending.append(
-            {
-                "topic": topic,
-                "count": len(dates),
-                "growth": len(
-                    [
-                        d
-                        for d in dates
-                        if d >= (datetime.utcnow() - timedelta(days=3)).strftime("%Y-%m-%d")
-                    ]
-                ),
-            }
+    async def compute() -> dict[str, list[dict[str, str | int]]]:
+        cutoff_date = datetime.utcnow() - timedelta(days=days)
+
+        rows = await db.execute(
+            select(Article.topics, func.date(Article.published_date))
+            .join(Feed, Article.feed_id == Feed.id)
+            .where(
+                Feed.user_id == current_user.id,
+                Article.topics.isnot(None),
+                Article.published_date >= cutoff_date,
+            )
         )
 
-    # Sort by recent growth
-    trending.sort(key=lambda x: x["growth"], reverse=True)
-
-    return {"trending_topics": trending[:20]}
+        # Track topics over time
+        topic_timeline: dict[str, list[str]] = {}
+
+        for topics, date_key in rows:
+            if topics and date_key:
+                date_key = str(date_key)
+                for topic in topics[:5]:  # Top 5 topics per article
+                    if topic not in topic_timeline:
+                        topic_timeline[topic] = []
+                    topic_timeline[topic].append(date_key)
+
+        # Calculate trending topics
+        growth_cutoff = (datetime.utcnow() - timedelta(days=3)).strftime("%Y-%m-%d")
+        trending: list[dict[str, str | int]] = []
+        for topic, dates in topic_timeline.items():
+            trending.append(
+                {
+                    "topic": topic,
+                    "count": len(dates),
+                    "growth": len([d for d in dates if d >= growth_cutoff]),
+                }
+            )
+
+        # Sort by recent growth
+        trending.sort(key=lambda x: x["growth"], reverse=True)
+
+        return {"trending_topics": trending[:20]}
+
+    return await _cached_analytics(
+        request, response, f"analytics:topic-trends:{current_user.id}:{days}", compute
+    )
 
 
 @router.get("/analytics/clusters", response_model=dict[str, list[dict[str, int | list[int]]]])
-def get_cluster_analytics(
-    db: Session = Depends(get_db),
+async def get_cluster_analytics(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ) -> dict[str, list[dict[str, int | list[int]]]]:
     """Get article cluster information."""
-    articles = (
-        db.query(Article)
-        .join(Article.feed)
-        .filter(Article.feed.has(user_id=current_user.id), Article.cluster_id.isnot(None))
-        .all()
-    )
 
-    # Group by cluster
-    clusters: dict[int, list[int]] = {}
-    for article in articles:
-        cluster_id = article.cluster_id
-        if cluster_id not in clusters:
-            clusters[cluster_id] = []
-        clusters[cluster_id].append(article.id)
+    async def compute() -> dict[str, list[dict[str, int | list[int]]]]:
+        # Count per cluster in SQL; a second two-column query collects sample IDs
+        counts = dict(
+            (
+                await db.execute(
+                    select(Article.cluster_id, func.count(Article.id))
+                    .join(Feed, Article.feed_id == Feed.id)
+                    .where(Feed.user_id == current_user.id, Article.cluster_id.isnot(None))
+                    .group_by(Article.cluster_id)
+                )
+            ).all()
+        )
 
-    # Format response
-    cluster_data = [
-        {"cluster_id": cid, "article_count": len(articles), "article_ids": articles[:10]}
-        for cid, articles in clusters.items()
-    ]
+        sample_ids: dict[int, list[int]] = {cid: [] for cid in counts}
+        id_rows = await db.execute(
+            select(Article.cluster_id, Article.id)
+            .join(Feed, Article.feed_id == Feed.id)
+            .where(Feed.user_id == current_user.id, Article.cluster_id.isnot(None))
+        )
+        for cluster_id, article_id in id_rows:
+            ids = sample_ids[cluster_id]
+            if len(ids) < 10:
+                ids.append(article_id)
+
+        # Format response
+        cluster_data = [
+            {"cluster_id": cid, "article_count": count, "article_ids": sample_ids[cid]}
+            for cid, count in counts.items()
+        ]
+
+        cluster_data.sort(key=lambda x: x["article_count"], reverse=True)
 
-    cluster_data.sort(key=lambda x: x["article_count"], reverse=True)
+        return {"clusters": cluster_data}
 
-    return {"clusters": cluster_data}
+    return await _cached_analytics(
+        request, response, f"analytics:clusters:{current_user.id}", compute
+    )
 
 
 @router.get("/export/csv")
@@ -489,59 +621,70 @@ def export_articles_csv(
 
     from fastapi.responses import StreamingResponse
 
-    # Build query with same filters as list endpoint
-    query = db.query(Article).join(Article.feed).filter(Article.feed.has(user_id=current_user.id))
+    # Build query with same filters as list endpoint; select only exported columns
+    query = _user_articles(db, current_user.id).with_entities(
+        Article.id,
+        Article.title,
+        Article.link,
+        Article.author,
+        Article.published_date,
+        Article.sentiment_score,
+        Article.topics,
+        Article.is_read,
+        Article.is_bookmarked,
+    )
 
     if min_sentiment is not None:
         query = query.filter(Article.sentiment_score >= min_sentiment)
     if max_sentiment is not None:
         query = query.filter(Article.sentiment_score <= max_sentiment)
     if topic:
-        query = query.filter(Article.topics.like(f'%"{topic}"%'))
-
-    articles = query.order_by(Article.published_date.desc()).all()
-
-    # Create CSV
-    output = StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    writer.writerow(
-        [
-            "ID",
-            "Title",
-            "Link",
-            "Author",
-            "Published Date",
-            "Sentiment Score",
-            "Topics",
-            "Is Read",
-            "Is Bookmarked",
-        ]
-    )
+        query = query.filter(_topic_filter(topic))
 
-    # Rows
-    for article in articles:
-        topics_str = "; ".join(article.topics) if article.topics else ""
+    query = query.order_by(Article.published_date.desc())
+
+    def generate():
+        # Stream row batches instead of building the whole CSV in memory
+        buffer = StringIO()
+        writer = csv.writer(buffer)
 
         writer.writerow(
             [
-                article.id,
-                article.title,
-                article.link,
-                article.author or "",
-                article.published_date.isoformat() if article.published_date else "",
-                article.sentiment_score if article.sentiment_score is not None else "",
-                topics_str,
-                article.is_read,
-                article.is_bookmarked,
+                "ID",
+                "Title",
+                "Link",
+                "Author",
+                "Published Date",
+                "Sentiment Score",
+                "Topics",
+                "Is Read",
+                "Is Bookmarked",
             ]
         )
-
-    output.seek(0)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+        for row in query.yield_per(1000):
+            writer.writerow(
+                [
+                    row.id,
+                    row.title,
+                    row.link,
+                    row.author or "",
+                    row.published_date.isoformat() if row.published_date else "",
+                    row.sentiment_score if row.sentiment_score is not None else "",
+                    "; ".join(row.topics) if row.topics else "",
+                    row.is_read,
+                    row.is_bookmarked,
+                ]
+            )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
 
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate(),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=articles.csv"},
     )
@@ -558,42 +701,55 @@ def export_articles_json(
     """Export articles as JSON."""
     from fastapi.responses import StreamingResponse
 
-    # Build query with same filters
-    query = db.query(Article).join(Article.feed).filter(Article.feed.has(user_id=current_user.id))
+    # Build query with same filters; select only exported columns
+    query = _user_articles(db, current_user.id).with_entities(
+        Article.id,
+        Article.title,
+        Article.link,
+        Article.description,
+        Article.author,
+        Article.published_date,
+        Article.sentiment_score,
+        Article.topics,
+        Article.is_read,
+        Article.is_bookmarked,
+    )
 
     if min_sentiment is not None:
         query = query.filter(Article.sentiment_score >= min_sentiment)
     if max_sentiment is not None:
         query = query.filter(Article.sentiment_score <= max_sentiment)
     if topic:
-        query = query.filter(Article.topics.like(f'%"{topic}"%'))
-
-    articles = query.order_by(Article.published_date.desc()).all()
-
-    # Convert to dict
-    articles_data = []
-    for article in articles:
-        articles_data.append(
-            {
-                "id": article.id,
-                "title": article.title,
-                "link": article.link,
-                "description": article.description,
-                "author": article.author,
-                "published_date": (
-                    article.published_date.isoformat() if article.published_date else None
-                ),
-                "sentiment_score": article.sentiment_score,
-                "topics": article.topics,
-                "is_read": article.is_read,
-                "is_bookmarked": article.is_bookmarked,
+        query = query.filter(_topic_filter(topic))
+
+    query = query.order_by(Article.published_date.desc())
+
+    def generate():
+        # Stream one JSON array element per row instead of one giant dumps();
+        # orjson serializes each element in C and emits bytes directly
+        import orjson
+
+        yield b'{"articles": ['
+        count = 0
+        for row in query.yield_per(1000):
+            item = {
+                "id": row.id,
+                "title": row.title,
+                "link": row.link,
+                "description": row.description,
+                "author": row.author,
+                "published_date": (row.published_date.isoformat() if row.published_date else None),
+                "sentiment_score": row.sentiment_score,
+                "topics": row.topics,
+                "is_read": row.is_read,
+                "is_bookmarked": row.is_bookmarked,
             }
-        )
-
-    json_str = json.dumps({"articles": articles_data, "count": len(articles_data)}, indent=2)
+            yield (b"," if count else b"") + orjson.dumps(item)
+            count += 1
+        yield b'], "count": ' + str(count).encode() + b"}"
 
     return StreamingResponse(
-        iter([json_str]),
+        generate(),
         media_type="application/json",
         headers={"Content-Disposition": "attachment; filename=articles.json"},
     )
@@ -1,5 +1,6 @@
 """Authentication endpoints."""
 
+import logging
 from datetime import timedelta
 from typing import Optional
 
@@ -7,6 +8,7 @@ from authlib.integrations.starlette_client import OAuth
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import RedirectResponse
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -17,8 +19,27 @@ from app.schemas.user import Token
 from app.schemas.user import User as UserSchema
 from app.schemas.user import UserCreate
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+
+def _user_by_email(db: Session, email: str) -> User | None:
+    """Look up a user by email, case-insensitively, through a cached lambda statement.
+
+    lower(email) = lower(:email) matches the ix_users_email_lower functional
+    index, so Admin@x.com and admin@x.com resolve to the same account without
+    a sequential scan.
+    """
+    lowered = email.lower()
+    stmt = lambda_stmt(lambda: select(User).where(func.lower(User.email) == lowered))
+    return db.execute(stmt).scalar_one_or_none()
+
+
+# Hash verified when the account is unknown (or has no password), so login
+# takes the same time whether or not the email exists
+_DUMMY_PASSWORD_HASH = get_password_hash("dummy-password")
+
 # Initialize OAuth
 oauth = OAuth()
 
@@ -51,25 +72,14 @@ def login(
     db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> dict[str, str]:
     """Login user and return access token."""
-    print(
-        f"[DEBUG] Login attempt - username: {form_data.username}, password length: {len(form_data.password)}"
-    )
+    user = _user_by_email(db, form_data.username)
 
-    user = db.query(User).filter(User.email == form_data.username).first()
+    # Verify against a dummy hash for unknown or passwordless (OAuth) accounts
+    # so timing does not reveal whether the email exists
+    hashed = user.hashed_password if user and user.hashed_password else _DUMMY_PASSWORD_HASH
+    password_ok = verify_password(form_data.password, hashed)
 
-    if not user:
-        print(f"[DEBUG] User not found: {form_data.username}")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    print(f"[DEBUG] User found: {user.email}, checking password...")
-    password_ok = verify_password(form_data.password, user.hashed_password)
-    print(f"[DEBUG] Password verification result: {password_ok}")
-
-    if not password_ok:
+    if not user or not user.hashed_password or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -129,7 +139,7 @@ async def google_callback(request: Request, db: Session = Depends(get_db)) -> di
             )
 
         # Check if user exists
-        user = db.query(User).filter(User.email == email).first()
+        user = _user_by_email(db, email)
 
         if user:
             # Update OAuth info if user exists
@@ -153,6 +163,11 @@ async def google_callback(request: Request, db: Session = Depends(get_db)) -> di
         db.commit()
         db.refresh(user)
 
+        # The user row changed; drop any cached auth entry
+        from app.api.deps import invalidate_user_cache
+
+        invalidate_user_cache(user.id)
+
         # Create access token
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(subject=user.id, expires_delta=access_token_expires)
@@ -162,7 +177,7 @@ async def google_callback(request: Request, db: Session = Depends(get_db)) -> di
         return RedirectResponse(url=f"{frontend_url}/auth/callback?token={access_token}")
 
     except Exception as e:
-        print(f"[ERROR] Google OAuth callback failed: {e}")
+        logger.error("Google OAuth callback failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"OAuth authentication failed: {str(e)}",
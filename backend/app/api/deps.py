@@ -1,20 +1,139 @@
 """API dependencies."""
 
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import threading
+import time
+from typing import NamedTuple
+
 import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jwt import InvalidTokenError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.db.base import get_db
+from app.db.base import get_async_db
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# One PyJWT instance and a preparsed algorithm list, reused across requests
+# instead of rebuilt inside the module-level jwt.decode wrapper on every call
+_jwt = jwt.PyJWT()
+_ALGORITHMS = [settings.ALGORITHM]
+
+# Decoded payloads are deterministic for a given token until expiry, so a
+# short-TTL cache skips the HMAC verification + JSON parse on repeat requests
+_decode_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_decode_cache_lock = threading.Lock()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Base64url-decode a JWT segment, restoring stripped padding."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _verify_hs256(token: str, key: str) -> dict | None:
+    """Fast-path HS256 verification: split, one HMAC, constant-time compare.
+
+    Skips PyJWT's algorithm registry and option handling for the tokens this
+    app issues itself. Returns None whenever anything looks unusual (wrong
+    segment count, non-HS256 header, undecodable JSON, bad signature) so the
+    caller can fall back to the full PyJWT decode and its canonical errors.
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        signature = _b64url_decode(signature_b64)
+        expected = hmac.new(
+            key.encode(), f"{header_b64}.{payload_b64}".encode(), hashlib.sha256
+        ).digest()
+        if not hmac.compare_digest(signature, expected):
+            return None
+        header = json.loads(_b64url_decode(header_b64))
+        if header.get("alg") != "HS256":
+            return None
+        payload = json.loads(_b64url_decode(payload_b64))
+    except (ValueError, binascii.Error):
+        return None
+
+    exp = payload.get("exp")
+    if exp is not None and exp < time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
+
+def _decode_token(token: str) -> dict:
+    """Decode a JWT, briefly caching payloads keyed by the raw token.
+
+    Cached payloads are still checked against their exp claim, so an expired
+    token falls through to a fresh decode and raises like an uncached one.
+    """
+    with _decode_cache_lock:
+        payload = _decode_cache.get(token)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    payload = _verify_hs256(token, settings.SECRET_KEY)
+    if payload is None:
+        payload = _jwt.decode(token, settings.SECRET_KEY, algorithms=_ALGORITHMS)
+    with _decode_cache_lock:
+        _decode_cache[token] = payload
+    return payload
+
+
+class _CachedUser(NamedTuple):
+    """The User fields the auth dependencies (and endpoints) actually consume."""
 
-def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
-    """Get current authenticated user."""
+    id: int
+    is_active: bool
+
+
+# Short-TTL cache of the per-request user lookup; endpoints only touch id and
+# is_active, so a lightweight record stands in for the ORM row
+_user_cache: TTLCache = TTLCache(maxsize=50_000, ttl=30)
+_user_cache_lock = threading.Lock()
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Drop a user's cached auth entry after their row is updated."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+async def get_token_payload(token: str = Depends(oauth2_scheme)) -> dict:
+    """Decode and verify the bearer token, returning its claims.
+
+    Split out of get_current_user so dependencies that only need the token
+    subject (cache keys, per-user rate limits) can share the decoded payload
+    through FastAPI's per-request dependency cache without paying for the
+    user lookup. Token verification is CPU-bound (HMAC + JSON parse), so it
+    runs in the threadpool instead of blocking the event loop.
+    """
+    try:
+        return await run_in_threadpool(_decode_token, token)
+    except InvalidTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_async_db), payload: dict = Depends(get_token_payload)
+) -> "User | _CachedUser":
+    """Get current authenticated user.
+
+    The user lookup goes through the async session's primary-key path and is
+    cached for a short TTL, removing one SELECT per request for active
+    sessions.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -22,17 +141,21 @@ def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_
     )
 
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: int | None = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except InvalidTokenError:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    user = await db.get(User, user_id)
     if user is None:
         raise credentials_exception
 
+    with _user_cache_lock:
+        _user_cache[user_id] = _CachedUser(id=user.id, is_active=user.is_active)
     return user
 
 
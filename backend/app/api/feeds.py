@@ -1,114 +1,190 @@
 """Feed management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user
-from app.db.base import get_db
+from app.core.cache import cache_delete_prefix, cache_get, cache_set
+from app.db.base import get_async_db, get_db
 from app.models.feed import Feed
 from app.models.user import User
+from app.schemas.feed import FEED_LIST_ADAPTER
 from app.schemas.feed import Feed as FeedSchema
 from app.schemas.feed import FeedCreate, FeedUpdate
 from app.services.rss_fetcher import RSSFetcher
 
 router = APIRouter()
 
+# Feed lists are read-mostly; a short Redis TTL turns repeat reads into one
+# Redis GET, and every mutating endpoint drops the user's cached pages
+_FEEDS_CACHE_TTL = 30
+
+
+async def _invalidate_feeds_cache(user_id: int) -> None:
+    """Drop all cached feed-list pages for a user after a mutation."""
+    await cache_delete_prefix(f"resp:feeds:{user_id}:")
+
+
+async def _get_owned_feed(db: AsyncSession, user_id: int, feed_id: int) -> Feed:
+    """Fetch a feed by primary key and verify ownership.
+
+    Session.get uses the identity map and a precompiled PK statement, so
+    repeat lookups skip query construction, and rows already in the session
+    skip SQL entirely.
+    """
+    feed = await db.get(Feed, feed_id)
+    if feed is None or feed.user_id != user_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Feed not found")
+    return feed
+
 
 @router.get("/", response_model=list[FeedSchema])
-def list_feeds(
-    db: Session = Depends(get_db),
+async def list_feeds(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
     skip: int = 0,
     limit: int = 100,
-) -> list[Feed]:
+):
     """List user's feeds."""
-    feeds = db.query(Feed).filter(Feed.user_id == current_user.id).offset(skip).limit(limit).all()
-    return feeds
+    cache_key = f"resp:feeds:{current_user.id}:{skip}:{limit}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        # Cached value is the serialized body; send it as-is
+        return Response(content=cached, media_type="application/json")
+
+    # Core column select: rows skip ORM entity construction and the identity
+    # map; the response model validates straight off the Row attributes
+    result = await db.execute(
+        select(
+            Feed.id,
+            Feed.url,
+            Feed.title,
+            Feed.description,
+            Feed.country_code,
+            Feed.category,
+            Feed.is_library,
+            Feed.last_fetched,
+            Feed.is_active,
+            Feed.user_id,
+        )
+        .where(Feed.user_id == current_user.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = result.all()
+
+    # The shared TypeAdapter reuses its prebuilt core schema for validation
+    # and serialization, bypassing per-response response_model handling; the
+    # serialized bytes double as the cached body
+    body = FEED_LIST_ADAPTER.dump_json(FEED_LIST_ADAPTER.validate_python(rows))
+    await cache_set(cache_key, body.decode(), _FEEDS_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/", response_model=FeedSchema, status_code=status.HTTP_201_CREATED)
-def create_feed(
+async def create_feed(
     feed_in: FeedCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
-) -> Feed:
+):
     """Create new feed."""
-    # Check if feed already exists for this user
-    existing = (
-        db.query(Feed).filter(Feed.url == str(feed_in.url), Feed.user_id == current_user.id).first()
+    # Single INSERT .. ON CONFLICT DO NOTHING .. RETURNING instead of a
+    # SELECT-then-INSERT pair; the unique (user_id, url) index arbitrates
+    # duplicates race-free on the DB side
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+    stmt = (
+        dialect_insert(Feed)
+        .values(
+            url=str(feed_in.url),
+            title=feed_in.title,
+            description=feed_in.description,
+            user_id=current_user.id,
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "url"])
+        .returning(*Feed.__table__.columns)
     )
+    row = (await db.execute(stmt)).one_or_none()
 
-    if existing:
+    if row is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Feed already exists",
         )
 
-    feed = Feed(
-        url=str(feed_in.url),
-        title=feed_in.title,
-        description=feed_in.description,
-        user_id=current_user.id,
-    )
-    db.add(feed)
-    db.commit()
-    db.refresh(feed)
-
-    return feed
+    await db.commit()
+    await _invalidate_feeds_cache(current_user.id)
+    return row
 
 
 @router.get("/{feed_id}", response_model=FeedSchema)
-def get_feed(
+async def get_feed(
     feed_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Feed:
     """Get feed by ID."""
-    feed = db.query(Feed).filter(Feed.id == feed_id, Feed.user_id == current_user.id).first()
-
-    if not feed:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Feed not found")
-
-    return feed
+    return await _get_owned_feed(db, current_user.id, feed_id)
 
 
 @router.put("/{feed_id}", response_model=FeedSchema)
-def update_feed(
+async def update_feed(
     feed_id: int,
     feed_in: FeedUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
-) -> Feed:
+):
     """Update feed."""
-    feed = db.query(Feed).filter(Feed.id == feed_id, Feed.user_id == current_user.id).first()
+    update_data = feed_in.model_dump(exclude_unset=True)
+    if not update_data:
+        return await _get_owned_feed(db, current_user.id, feed_id)
+
+    # One UPDATE .. RETURNING replaces the load-mutate-flush cycle; the
+    # WHERE clause carries the ownership check so an unmatched row is a 404
+    row = (
+        await db.execute(
+            update(Feed)
+            .where(Feed.id == feed_id, Feed.user_id == current_user.id)
+            .values(**update_data)
+            .returning(*Feed.__table__.columns)
+        )
+    ).one_or_none()
 
-    if not feed:
+    if row is None:
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Feed not found")
 
-    update_data = feed_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(feed, field, value)
-
-    db.commit()
-    db.refresh(feed)
+    await db.commit()
+    await _invalidate_feeds_cache(current_user.id)
 
-    return feed
+    return row
 
 
 @router.delete("/{feed_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_feed(
+async def delete_feed(
     feed_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ) -> None:
     """Delete feed."""
-    feed = db.query(Feed).filter(Feed.id == feed_id, Feed.user_id == current_user.id).first()
+    # Single DELETE with the ownership check in the WHERE clause; rowcount
+    # distinguishes a miss from a delete without loading the entity first
+    result = await db.execute(
+        delete(Feed).where(Feed.id == feed_id, Feed.user_id == current_user.id)
+    )
 
-    if not feed:
+    if result.rowcount == 0:
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Feed not found")
 
-    db.delete(feed)
-    db.commit()
+    await db.commit()
+    await _invalidate_feeds_cache(current_user.id)
 
 
 @router.post("/{feed_id}/refresh", response_model=dict[str, int])
@@ -118,13 +194,15 @@ async def refresh_feed(
     current_user: User = Depends(get_current_active_user),
 ) -> dict[str, int]:
     """Refresh feed and fetch new articles."""
-    feed = db.query(Feed).filter(Feed.id == feed_id, Feed.user_id == current_user.id).first()
-
-    if not feed:
+    # RSSFetcher persists through the sync session, so the ownership check
+    # stays on the same session instead of going through _get_owned_feed
+    feed = db.get(Feed, feed_id)
+    if feed is None or feed.user_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Feed not found")
 
     fetcher = RSSFetcher(db)
     new_articles = await fetcher.update_feed(feed)
+    await _invalidate_feeds_cache(current_user.id)
 
     return {"new_articles": len(new_articles)}
 
@@ -137,5 +215,6 @@ async def refresh_all_feeds(
     """Refresh all user's feeds."""
     fetcher = RSSFetcher(db)
     result = await fetcher.update_all_feeds(current_user.id)
+    await _invalidate_feeds_cache(current_user.id)
 
     return result
@@ -1,44 +1,77 @@
 """User preferences endpoints."""
 
+import json
+
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user
-from app.db.base import get_db
+from app.core.cache import cache_delete, cache_get, cache_set
+from app.db.base import get_async_db
 from app.models.feed import UserPreference
 from app.models.user import User
+from app.schemas import from_orm_fast
 from app.schemas.feed import UserPreference as UserPreferenceSchema
 from app.schemas.feed import UserPreferenceUpdate
 
 router = APIRouter()
 
+# Preferences change rarely; a short Redis TTL keeps repeat reads off the DB,
+# and update_preferences drops the entry so changes are visible immediately
+_PREFERENCES_CACHE_TTL = 30
+
+
+def _preferences_cache_key(user_id: int) -> str:
+    return f"resp:preferences:{user_id}"
+
 
 @router.get("/", response_model=UserPreferenceSchema)
-def get_preferences(
-    db: Session = Depends(get_db),
+async def get_preferences(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
-) -> UserPreference:
+):
     """Get user preferences."""
-    preferences = db.query(UserPreference).filter(UserPreference.user_id == current_user.id).first()
+    cache_key = _preferences_cache_key(current_user.id)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return json.loads(cached)
 
-    if not preferences:
-        # Create default preferences
-        preferences = UserPreference(user_id=current_user.id)
-        db.add(preferences)
-        db.commit()
-        db.refresh(preferences)
+    # Single INSERT .. ON CONFLICT DO UPDATE .. RETURNING: fetches or creates
+    # the row in one round-trip, so concurrent first requests can't race the
+    # old SELECT-then-INSERT pair into an IntegrityError
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
 
-    return preferences
+    stmt = (
+        dialect_insert(UserPreference)
+        .values(user_id=current_user.id)
+        .on_conflict_do_update(index_elements=["user_id"], set_={"user_id": current_user.id})
+        .returning(*UserPreference.__table__.columns)
+    )
+    preferences = (await db.execute(stmt)).one()
+    await db.commit()
+
+    # Trusted DB row: construct without re-validating what the columns
+    # already guarantee
+    payload = from_orm_fast(UserPreferenceSchema, preferences).model_dump(mode="json")
+    await cache_set(cache_key, json.dumps(payload), _PREFERENCES_CACHE_TTL)
+    return payload
 
 
 @router.put("/", response_model=UserPreferenceSchema)
-def update_preferences(
+async def update_preferences(
     preferences_in: UserPreferenceUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ) -> UserPreference:
     """Update user preferences."""
-    preferences = db.query(UserPreference).filter(UserPreference.user_id == current_user.id).first()
+    result = await db.execute(
+        select(UserPreference).where(UserPreference.user_id == current_user.id)
+    )
+    preferences = result.scalar_one_or_none()
 
     if not preferences:
         # Create new preferences
@@ -49,7 +82,8 @@ def update_preferences(
     for field, value in update_data.items():
         setattr(preferences, field, value)
 
-    db.commit()
-    db.refresh(preferences)
+    await db.commit()
+    await db.refresh(preferences)
+    await cache_delete(_preferences_cache_key(current_user.id))
 
     return preferences
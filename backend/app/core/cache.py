@@ -0,0 +1,100 @@
+"""Best-effort Redis cache helpers.
+
+Every operation degrades to a cache miss when Redis is unreachable, so the
+application (and the test suite) works without a running Redis instance. The
+helpers are async and use the asyncio Redis client, since every call site is
+a coroutine: a blocking client here would put socket I/O on the event loop.
+After a failure, Redis is skipped entirely for a short window instead of
+re-paying the connect timeout on every request.
+"""
+
+import logging
+import time
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: redis.Redis | None = None
+
+# How long to short-circuit to cache misses after a Redis failure
+_RETRY_AFTER = 30.0
+_down_until = 0.0
+
+
+def _get_client() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    return _client
+
+
+def _available() -> bool:
+    return time.monotonic() >= _down_until
+
+
+def _mark_down(key: str) -> None:
+    global _down_until
+    _down_until = time.monotonic() + _RETRY_AFTER
+    logger.debug("Redis unavailable, backing off %.0fs (key %s)", _RETRY_AFTER, key)
+
+
+async def close_cache() -> None:
+    """Close the shared Redis client (called from the app lifespan)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+
+
+async def cache_get(key: str) -> str | None:
+    """Fetch a cached value, treating any Redis failure as a miss."""
+    if not _available():
+        return None
+    try:
+        # decode_responses=True means values come back as str
+        value: str | None = await _get_client().get(key)
+        return value
+    except (redis.RedisError, OSError):
+        _mark_down(key)
+        return None
+
+
+async def cache_set(key: str, value: str, ttl: int) -> None:
+    """Store a value with a TTL, ignoring Redis failures."""
+    if not _available():
+        return
+    try:
+        await _get_client().setex(key, ttl, value)
+    except (redis.RedisError, OSError):
+        _mark_down(key)
+
+
+async def cache_delete(key: str) -> None:
+    """Drop a single key, ignoring Redis failures."""
+    if not _available():
+        return
+    try:
+        await _get_client().delete(key)
+    except (redis.RedisError, OSError):
+        _mark_down(key)
+
+
+async def cache_delete_prefix(prefix: str) -> None:
+    """Drop every key under a prefix, ignoring Redis failures."""
+    if not _available():
+        return
+    try:
+        client = _get_client()
+        keys = [key async for key in client.scan_iter(match=f"{prefix}*")]
+        if keys:
+            await client.delete(*keys)
+    except (redis.RedisError, OSError):
+        _mark_down(prefix)
@@ -39,6 +39,12 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_TIMEOUT_MS: int = 5000
+    # Disable app-side pooling when running behind pgbouncer in transaction mode
+    DB_USE_NULLPOOL: bool = False
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
@@ -52,10 +58,21 @@ class Settings(BaseSettings):
     DEFAULT_LLM_PROVIDER: str = "anthropic"
     LLM_MODEL_OPENAI: str = "gpt-4-turbo-preview"
     LLM_MODEL_ANTHROPIC: str = "claude-3-5-sonnet-20241022"
+    # Cap on concurrent LLM calls when fanning out over claims/articles
+    LLM_MAX_CONCURRENCY: int = 10
 
     # NLP Settings
     SENTENCE_TRANSFORMER_MODEL: str = "all-MiniLM-L6-v2"
     CLUSTERING_MIN_SAMPLES: int = 3
+    SPACY_NER_MODEL: str = "en_core_web_sm"
+    SPACY_BATCH_SIZE: int = 64
+    # Lazy-spaCy: keep ingest on the cheap regex extractor and reserve spaCy
+    # NER for on-demand analysis, so feed ingestion stays I/O bound
+    LAZY_SPACY: bool = True
+    # Serve sentence embeddings through ONNX Runtime (requires the optional
+    # optimum[onnxruntime] extra); falls back to SentenceTransformer if the
+    # export or import fails
+    USE_ONNX_ENCODER: bool = False
 
     # Environment
     ENVIRONMENT: str = "development"
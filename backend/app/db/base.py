@@ -1,14 +1,60 @@
 """Database session and base configuration."""
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
-engine = create_engine(str(settings.DATABASE_URL), pool_pre_ping=True)
+
+def _async_database_url(url: str) -> str:
+    """Map the configured DATABASE_URL onto its async driver equivalent."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+def _engine_kwargs(url: str, async_driver: bool = False) -> dict:
+    """Pool sizing and server-side safety nets for PostgreSQL engines.
+
+    SQLite keeps the driver defaults; under pgbouncer transaction pooling the
+    app-side pool is disabled entirely (DB_USE_NULLPOOL).
+    """
+    kwargs: dict = {"pool_pre_ping": True}
+    if not url.startswith("postgresql"):
+        return kwargs
+
+    if settings.DB_USE_NULLPOOL:
+        kwargs["poolclass"] = NullPool
+    else:
+        kwargs.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+
+    timeout = settings.DB_STATEMENT_TIMEOUT_MS
+    if timeout > 0:
+        if async_driver:  # asyncpg takes server settings as a dict
+            kwargs["connect_args"] = {"server_settings": {"statement_timeout": str(timeout)}}
+        else:
+            kwargs["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return kwargs
+
+
+engine = create_engine(str(settings.DATABASE_URL), **_engine_kwargs(str(settings.DATABASE_URL)))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    _async_database_url(str(settings.DATABASE_URL)),
+    **_engine_kwargs(str(settings.DATABASE_URL), async_driver=True),
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -19,3 +65,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Get async database session (read-path endpoints)."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,6 +1,6 @@
 """Database models."""
 
-from app.models.feed import Article, Feed, UserPreference
+from app.models.feed import Article, ArticleFactCheck, ArticleInsight, Feed, UserPreference
 from app.models.user import User
 
-__all__ = ["User", "Feed", "Article", "UserPreference"]
+__all__ = ["User", "Feed", "Article", "ArticleInsight", "ArticleFactCheck", "UserPreference"]
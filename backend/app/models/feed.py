@@ -3,8 +3,21 @@
 import json as json_lib
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import TypeDecorator
 
@@ -33,13 +46,40 @@ class JSONEncodedList(TypeDecorator):
             return None
 
 
+class JSONEncodedDict(TypeDecorator):
+    """Represents a JSON object as TEXT, mirroring JSONEncodedList."""
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        """Convert Python dict to JSON string."""
+        if value is None:
+            return None
+        return json_lib.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        """Convert JSON string to Python dict."""
+        if value is None:
+            return None
+        try:
+            return json_lib.loads(value)
+        except (json_lib.JSONDecodeError, TypeError):
+            return None
+
+
 class Feed(Base):
     """RSS Feed model."""
 
     __tablename__ = "feeds"
+    __table_args__ = (
+        # Per-user uniqueness: two users may follow the same feed URL, and the
+        # unique index is what INSERT .. ON CONFLICT targets in create_feed
+        Index("uq_feeds_user_id_url", "user_id", "url", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    url = Column(String, unique=True, index=True, nullable=False)
+    url = Column(String, index=True, nullable=False)
     title = Column(String, nullable=True)
     description = Column(Text, nullable=True)
     country_code = Column(String(2), nullable=True)  # ISO 3166-1 alpha-2 country code
@@ -47,7 +87,7 @@ class Feed(Base):
     is_library = Column(Boolean, default=False)  # Whether this is a library feed
     last_fetched = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
     owner = relationship("User", back_populates="feeds")
     articles = relationship("Article", back_populates="feed")
@@ -57,10 +97,28 @@ class Article(Base):
     """Article model."""
 
     __tablename__ = "articles"
+    __table_args__ = (
+        Index("ix_articles_feed_id_published_date", "feed_id", "published_date"),
+        # Partial index serving the sort-by-sentiment path with LIMIT pushdown
+        Index(
+            "ix_articles_feed_id_sentiment_score",
+            "feed_id",
+            "sentiment_score",
+            postgresql_where=text("sentiment_score IS NOT NULL"),
+            sqlite_where=text("sentiment_score IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     feed_id = Column(Integer, ForeignKey("feeds.id"), nullable=False)
     title = Column(String, nullable=False)
+    # Title normalized at ingest (see fuzzy_matcher.normalize_text), so
+    # duplicate scans compare precomputed strings instead of re-normalizing
+    normalized_title = Column(String, nullable=True)
+    # 64-bit SimHash of the normalized title (see fuzzy_matcher.simhash64),
+    # stored two's-complement signed to fit BIGINT; lets duplicate scans
+    # reject most candidates with an XOR + popcount before any string compare
+    title_simhash = Column(BigInteger, nullable=True)
     link = Column(String, unique=True, index=True, nullable=False)
     description = Column(Text, nullable=True)
     content = Column(Text, nullable=True)
@@ -70,9 +128,13 @@ class Article(Base):
 
     # NLP fields
     embedding = Column(Text, nullable=True)  # Store as JSON string
+    # Same vector as raw float32 bytes: np.frombuffer restores it without a
+    # JSON parse; rows written before this column rely on the JSON fallback
+    embedding_blob = Column(LargeBinary, nullable=True)
     cluster_id = Column(Integer, nullable=True)
     sentiment_score = Column(Float, nullable=True)
-    topics = Column(JSONEncodedList, nullable=True)  # Auto-convert JSON to list
+    # JSON text on SQLite, native JSONB (GIN-indexable) on PostgreSQL
+    topics = Column(JSONEncodedList().with_variant(JSONB(), "postgresql"), nullable=True)
     readability_score = Column(Float, nullable=True)
     readability_label = Column(String, nullable=True)
     writing_style = Column(String, nullable=True)
@@ -85,6 +147,54 @@ class Article(Base):
     feed = relationship("Feed", back_populates="articles")
 
 
+class ArticleInsight(Base):
+    """Persisted LLM insight payload, the L2 behind the Redis cache.
+
+    Keyed by (article_id, model, content_hash): a content edit or model
+    change produces a new hash, so stale rows are simply never read again.
+    """
+
+    __tablename__ = "article_insights"
+    __table_args__ = (
+        Index(
+            "uq_article_insights_article_model_hash",
+            "article_id",
+            "model",
+            "content_hash",
+            unique=True,
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False)
+    model = Column(String, nullable=False)
+    content_hash = Column(String(32), nullable=False)
+    payload = Column(JSONEncodedDict().with_variant(JSONB(), "postgresql"), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ArticleFactCheck(Base):
+    """Persisted fact-check report, keyed like ArticleInsight."""
+
+    __tablename__ = "article_factchecks"
+    __table_args__ = (
+        Index(
+            "uq_article_factchecks_article_model_hash",
+            "article_id",
+            "model",
+            "content_hash",
+            unique=True,
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False)
+    model = Column(String, nullable=False)
+    content_hash = Column(String(32), nullable=False)
+    payload = Column(JSONEncodedDict().with_variant(JSONB(), "postgresql"), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class UserPreference(Base):
     """User reading preferences."""
 
@@ -93,12 +203,13 @@ class UserPreference(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
 
-    preferred_topics = Column(JSONEncodedList, default=list)
-    excluded_topics = Column(JSONEncodedList, default=list)
-    preferred_sources = Column(JSONEncodedList, default=list)
-    excluded_sources = Column(JSONEncodedList, default=list)
+    # JSON text on SQLite, native JSONB on PostgreSQL (no Python-level parse)
+    preferred_topics = Column(JSONEncodedList().with_variant(JSONB(), "postgresql"), default=list)
+    excluded_topics = Column(JSONEncodedList().with_variant(JSONB(), "postgresql"), default=list)
+    preferred_sources = Column(JSONEncodedList().with_variant(JSONB(), "postgresql"), default=list)
+    excluded_sources = Column(JSONEncodedList().with_variant(JSONB(), "postgresql"), default=list)
     excluded_words = Column(
-        JSONEncodedList, default=list
+        JSONEncodedList().with_variant(JSONB(), "postgresql"), default=list
     )  # Filter out articles containing these words
 
     # AI recommendation settings
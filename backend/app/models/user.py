@@ -1,6 +1,6 @@
 """User database models."""
 
-from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy import Boolean, Column, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -10,6 +10,10 @@ class User(Base):
     """User model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Functional index backing the case-insensitive login lookup
+        Index("ix_users_email_lower", text("lower(email)")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -12,7 +12,21 @@ from app.schemas.feed import (
 )
 from app.schemas.user import Token, User, UserCreate, UserUpdate
 
+
+def from_orm_fast(model_cls, obj):
+    """Build a schema instance from a trusted ORM row without validation.
+
+    model_construct skips pydantic validation entirely, so this is only for
+    rows coming straight from our own database, where the column types
+    already guarantee the schema's invariants — never for request input.
+    """
+    return model_cls.model_construct(
+        **{field: getattr(obj, field) for field in model_cls.model_fields}
+    )
+
+
 __all__ = [
+    "from_orm_fast",
     "User",
     "UserCreate",
     "UserUpdate",
@@ -1,21 +1,36 @@
 """Feed and Article schemas."""
 
 import json
+import re
 from datetime import datetime
 
-from pydantic import BaseModel, HttpUrl, field_validator
+from pydantic import BaseModel, TypeAdapter, field_validator
+
+# Cheap structural URL check: one compiled-regex match instead of Pydantic's
+# full HttpUrl parse (scheme/host/IDNA/port machinery) on every feed POST and
+# every article validated during ingestion
+_URL_RE = re.compile(r"^https?://\S+$")
+
+
+def _validate_url(value: str) -> str:
+    """Reject values that are not plausible http(s) URLs."""
+    if not _URL_RE.match(value):
+        raise ValueError("must be an http(s) URL")
+    return value
 
 
 class FeedBase(BaseModel):
     """Base feed schema."""
 
-    url: HttpUrl
+    url: str
     title: str | None = None
     description: str | None = None
     country_code: str | None = None
     category: str | None = None
     is_library: bool = False
 
+    _validate_url = field_validator("url")(_validate_url)
+
 
 class FeedCreate(FeedBase):
     """Feed creation schema."""
@@ -50,16 +65,23 @@ class Feed(FeedInDB):
     pass
 
 
+# Shared adapter with a prebuilt core schema; endpoints serialize feed lists
+# through it instead of FastAPI's per-response response_model machinery
+FEED_LIST_ADAPTER = TypeAdapter(list[Feed])
+
+
 class ArticleBase(BaseModel):
     """Base article schema."""
 
     title: str
-    link: HttpUrl
+    link: str
     description: str | None = None
     content: str | None = None
     author: str | None = None
     published_date: datetime | None = None
 
+    _validate_link = field_validator("link")(_validate_url)
+
 
 class ArticleInDB(ArticleBase):
     """Article schema from database."""
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class RuleCondition(BaseModel):
@@ -134,3 +134,11 @@ class ApplyTemplateRequest(BaseModel):
     apply_feeds: bool = True
     apply_rules: bool = True
     apply_preferences: bool = True
+
+
+# Shared adapters for list responses: one compiled validator/serializer per
+# process instead of per-call model_validate loops, matching FEED_LIST_ADAPTER.
+# Create/Update schemas stay plain BaseModel since they validate untrusted input.
+RULE_LIST_ADAPTER = TypeAdapter(list[Rule])
+PROMPT_TEMPLATE_LIST_ADAPTER = TypeAdapter(list[PromptTemplate])
+FEED_TEMPLATE_LIST_ADAPTER = TypeAdapter(list[FeedTemplate])
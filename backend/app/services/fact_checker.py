@@ -1,15 +1,123 @@
 """Fact-checking service using LLM and external APIs."""
 
+import asyncio
+import hashlib
 import json
+from collections import Counter
+from string import Template
 from typing import Any
 
 import anthropic
 import httpx
 import openai
+import orjson
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_get, cache_set
 from app.core.config import settings
-from app.models.feed import Article
+from app.models.feed import Article, ArticleFactCheck
+
+# Unchanged article text / claims hash to the same key, so repeat checks skip
+# the completion for a week
+_LLM_CACHE_TTL = 7 * 86400
+
+
+def _llm_cache_key(prefix: str, source: str) -> str:
+    """Build a cache key from a digest of prompt-determining text."""
+    return prefix + hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+
+
+# One pooled client for all web-search verification: per-call AsyncClient()
+# construction pays DNS, TCP and TLS setup on every claim, which dominates
+# latency in bulk verification. Created lazily so importing the module never
+# opens sockets; closed on app shutdown via close_http_client.
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared pooled HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called from the app lifespan)."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+# Prompt skeletons are compiled once at import; call sites substitute only the
+# variable article/claim text instead of rebuilding the full string each call
+EXTRACT_CLAIMS_TMPL = Template(
+    """Extract specific factual claims from this article that can be verified. Focus on:
+- Statistics and numbers
+- Dates and events
+- Quotes from named sources
+- Product launches or announcements
+- Scientific findings
+
+Article:
+$text
+
+Extract claims in JSON format:
+{"claims": [{"claim": "...", "category": "statistic|date|quote|announcement|finding", "importance": "high|medium|low"}]}"""
+)
+
+EXTRACT_CLAIMS_BULK_TMPL = Template(
+    """Extract specific factual claims from each numbered article below. Focus on:
+- Statistics and numbers
+- Dates and events
+- Quotes from named sources
+- Product launches or announcements
+- Scientific findings
+
+$sections
+
+Respond in JSON, mapping each article number to its claims:
+{"1": [{"claim": "...", "category": "statistic|date|quote|announcement|finding", "importance": "high|medium|low"}], "2": [...]}"""
+)
+
+FACT_CHECK_TMPL = Template(
+    """Analyze this claim for factual accuracy. Consider:
+1. Is the claim verifiable?
+2. Does it align with known facts?
+3. Are there any red flags or misleading elements?
+4. What additional context is needed?
+
+Claim: $claim
+
+Respond in JSON:
+{
+    "verdict": "likely_true|likely_false|misleading|needs_verification|opinion",
+    "confidence": 0.0-1.0,
+    "explanation": "...",
+    "red_flags": ["..."],
+    "context_needed": ["..."]
+}"""
+)
+
+FACT_CHECK_BULK_TMPL = Template(
+    """Analyze each numbered claim for factual accuracy. Consider:
+1. Is the claim verifiable?
+2. Does it align with known facts?
+3. Are there any red flags or misleading elements?
+4. What additional context is needed?
+
+Claims:
+$claims
+
+Respond in JSON, mapping each claim number to its assessment:
+{"1": {"verdict": "likely_true|likely_false|misleading|needs_verification|opinion",
+"confidence": 0.0-1.0, "explanation": "...", "red_flags": ["..."], "context_needed": ["..."]}, "2": {...}}"""
+)
 
 
 class FactChecker:
@@ -32,48 +140,280 @@ class FactChecker:
             self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
             self.model = settings.LLM_MODEL_ANTHROPIC
 
+    @staticmethod
+    def _article_text(article: Article) -> str:
+        """Title plus body, capped at 2000 chars.
+
+        The body is sliced before joining so long articles never allocate a
+        full-length intermediate string just to be truncated.
+        """
+        body = (article.content or article.description or "")[:2000]
+        return f"{article.title}\n\n{body}"[:2000]
+
+    def _build_extraction_prompt(self, article: Article) -> str:
+        """Build the claim-extraction prompt for an article."""
+        return EXTRACT_CLAIMS_TMPL.substitute(text=self._article_text(article))
+
+    @staticmethod
+    def _has_checkable_signals(text: str) -> bool:
+        """Cheap screen for text that could contain verifiable claims.
+
+        Claims worth extracting carry numbers, quotes, or named entities;
+        text with none of those (bare headlines, teaser blurbs) would spend a
+        completion to come back empty.
+        """
+        if any(ch.isdigit() for ch in text):
+            return True
+        if '"' in text or "“" in text or "”" in text:
+            return True
+        # Proper-noun heuristic: capitalized words beyond the leading one
+        capitalized = sum(1 for word in text.split()[1:] if word[:1].isupper())
+        return capitalized >= 2
+
+    @staticmethod
+    def _parse_claims(content: str) -> list[dict[str, Any]]:
+        """Parse a claim-extraction completion into a list of claims."""
+        claims = orjson.loads(content)
+        if isinstance(claims, dict):
+            # JSON mode responses wrap the array: {"claims": [...]}
+            claims = claims.get("claims", [])
+        return claims if isinstance(claims, list) else []
+
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        """Run one chat completion against the configured provider."""
+        if self.provider == "anthropic":
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            return response.content[0].text
+
+        response = openai.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=0.3,
+            # Every prompt here requests JSON; JSON mode guarantees the
+            # output parses, avoiding wasted completions and error retries
+            response_format={"type": "json_object"},
+        )
+        return response.choices[0].message.content or ""
+
+    async def _complete_async(self, prompt: str, max_tokens: int) -> str:
+        """Run _complete in a worker thread.
+
+        Both provider clients here are synchronous, so calling them directly
+        from a coroutine would block the event loop and serialize anything
+        gathered around them; the thread hop keeps concurrent claim
+        verification actually concurrent.
+        """
+        return await asyncio.to_thread(self._complete, prompt, max_tokens)
+
     async def extract_claims(self, article: Article) -> list[dict[str, Any]]:
         """Extract factual claims from article."""
         if not self.enabled or self.provider == "disabled":
             return []
 
-        text = f"{article.title}\n\n{article.content or article.description or ''}"
+        text = self._article_text(article)
+        if not self._has_checkable_signals(text):
+            return []
 
-        prompt = f"""Extract specific factual claims from this article that can be verified. Focus on:
-- Statistics and numbers
-- Dates and events
-- Quotes from named sources
-- Product launches or announcements
-- Scientific findings
+        prompt = EXTRACT_CLAIMS_TMPL.substitute(text=text)
 
-Article:
-{text[:2000]}
+        cache_key = _llm_cache_key("claims:", f"{prompt}|{self.model}")
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
 
-Extract claims in JSON format:
-[{{"claim": "...", "category": "statistic|date|quote|announcement|finding", "importance": "high|medium|low"}}]"""
+        try:
+            claims = self._parse_claims(await self._complete_async(prompt, 1000) or "[]")
+            await cache_set(cache_key, orjson.dumps(claims).decode(), _LLM_CACHE_TTL)
+            return claims
+
+        except Exception as e:
+            return [{"error": str(e)}]
+
+    # Rough character budget for a packed prompt, keeping K sections inside
+    # one completion's context window
+    _BULK_PROMPT_CHAR_BUDGET = 12_000
+
+    def _pack_items(self, texts: list[str], k: int) -> list[list[int]]:
+        """Group item indices into packs of at most k within the char budget.
+
+        Indices are ordered by text length before packing, so each pack holds
+        similar-sized items: headline-only stubs no longer share a completion
+        with full bodies, which keeps per-pack token budget and latency
+        predictable across a wave. Callers key results by index/article id,
+        so the reordering is invisible to them.
+        """
+        packs: list[list[int]] = []
+        current: list[int] = []
+        current_size = 0
+        for index in sorted(range(len(texts)), key=lambda i: len(texts[i])):
+            text = texts[index]
+            if current and (
+                len(current) >= k or current_size + len(text) > self._BULK_PROMPT_CHAR_BUDGET
+            ):
+                packs.append(current)
+                current, current_size = [], 0
+            current.append(index)
+            current_size += len(text)
+        if current:
+            packs.append(current)
+        return packs
+
+    async def extract_claims_bulk(
+        self, articles: list[Article], k: int = 8
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Extract claims for many articles, packing K per completion.
+
+        Requests-per-minute is usually the binding provider limit at this
+        prompt size, so amortizing one HTTP round-trip over K articles raises
+        ingestion throughput roughly K-fold. Returns article id -> claims,
+        with per-article error entries mirroring extract_claims.
+        """
+        if not self.enabled or self.provider == "disabled":
+            return {article.id: [] for article in articles}
+
+        texts = [self._article_text(article) for article in articles]
+        ids: list[int] = [article.id for article in articles]
+
+        results: dict[int, list[dict[str, Any]]] = {}
+        for pack in self._pack_items(texts, k):
+            sections = "\n\n".join(
+                f"### Article {position}\n{texts[index]}" for position, index in enumerate(pack, 1)
+            )
+            prompt = EXTRACT_CLAIMS_BULK_TMPL.substitute(sections=sections)
+
+            try:
+                parsed = orjson.loads(await self._complete_async(prompt, 1000 * len(pack)) or "{}")
+                for position, index in enumerate(pack, 1):
+                    claims = parsed.get(str(position), [])
+                    results[ids[index]] = claims if isinstance(claims, list) else []
+            except Exception as e:
+                for index in pack:
+                    results[ids[index]] = [{"error": str(e)}]
+
+        return results
+
+    def submit_batch(self, articles: list[Article]) -> dict[str, Any]:
+        """Submit a claim-extraction batch for offline fact-checking.
+
+        Non-interactive passes (e.g. nightly reliability scoring) go through
+        the provider batch APIs, which run outside per-minute rate limits and
+        price at roughly half the synchronous rate. Returns the batch id to
+        poll with poll_batch.
+        """
+        if not self.enabled or self.provider == "disabled" or not articles:
+            return {"error": "LLM features are disabled or no articles given"}
 
         try:
             if self.provider == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=1000,
-                    messages=[{"role": "user", "content": prompt}],
+                batch = self.client.messages.batches.create(
+                    requests=[
+                        {
+                            "custom_id": str(article.id),
+                            "params": {
+                                "model": self.model,
+                                "max_tokens": 1000,
+                                "messages": [
+                                    {
+                                        "role": "user",
+                                        "content": self._build_extraction_prompt(article),
+                                    }
+                                ],
+                            },
+                        }
+                        for article in articles
+                    ]
                 )
-                content = response.content[0].text
-            else:  # openai
-                response = openai.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=1000,
-                    temperature=0.3,
+                return {"provider": "anthropic", "batch_id": batch.id, "articles": len(articles)}
+
+            # openai
+            lines = [
+                json.dumps(
+                    {
+                        "custom_id": str(article.id),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.model,
+                            "messages": [
+                                {
+                                    "role": "user",
+                                    "content": self._build_extraction_prompt(article),
+                                }
+                            ],
+                            "max_tokens": 1000,
+                            "temperature": 0.3,
+                        },
+                    }
                 )
-                content = response.choices[0].message.content or "[]"
+                for article in articles
+            ]
+            batch_file = openai.files.create(
+                file=("fact_check_batch.jsonl", "\n".join(lines).encode()),
+                purpose="batch",
+            )
+            batch = openai.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            return {"provider": "openai", "batch_id": batch.id, "articles": len(articles)}
+
+        except Exception as e:
+            return {"error": str(e)}
+
+    def poll_batch(self, batch_id: str) -> dict[str, Any]:
+        """Fetch batch results, keyed back to article ids by custom_id.
 
-            claims = json.loads(content)
-            return claims if isinstance(claims, list) else []
+        Returns {"status": ...} while the batch is still running; once done,
+        "results" maps article id to its extracted claims (or an error entry,
+        mirroring extract_claims).
+        """
+        if not self.enabled or self.provider == "disabled":
+            return {"error": "LLM features are disabled"}
+
+        try:
+            results: dict[str, list[dict[str, Any]]] = {}
+
+            if self.provider == "anthropic":
+                batch = self.client.messages.batches.retrieve(batch_id)
+                if batch.processing_status != "ended":
+                    return {"status": batch.processing_status}
+
+                for entry in self.client.messages.batches.results(batch_id):
+                    if entry.result.type == "succeeded":
+                        results[entry.custom_id] = self._parse_claims(
+                            entry.result.message.content[0].text
+                        )
+                    else:
+                        results[entry.custom_id] = [{"error": entry.result.type}]
+                return {"status": "completed", "results": results}
+
+            # openai
+            batch = openai.batches.retrieve(batch_id)
+            if batch.status != "completed":
+                return {"status": batch.status}
+
+            output = openai.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                entry = orjson.loads(line)
+                custom_id = entry.get("custom_id", "")
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    content = response["body"]["choices"][0]["message"]["content"] or "[]"
+                    results[custom_id] = self._parse_claims(content)
+                else:
+                    results[custom_id] = [{"error": str(entry.get("error"))}]
+            return {"status": "completed", "results": results}
 
         except Exception as e:
-            return [{"error": str(e)}]
+            return {"error": str(e)}
 
     async def verify_claim(self, claim: str) -> dict[str, Any]:
         """Verify a single claim using LLM and web search."""
@@ -107,41 +447,17 @@ Extract claims in JSON format:
                 "context_needed": [],
             }
 
-        prompt = f"""Analyze this claim for factual accuracy. Consider:
-1. Is the claim verifiable?
-2. Does it align with known facts?
-3. Are there any red flags or misleading elements?
-4. What additional context is needed?
-
-Claim: {claim}
+        prompt = FACT_CHECK_TMPL.substitute(claim=claim)
 
-Respond in JSON:
-{{
-    "verdict": "likely_true|likely_false|misleading|needs_verification|opinion",
-    "confidence": 0.0-1.0,
-    "explanation": "...",
-    "red_flags": ["..."],
-    "context_needed": ["..."]
-}}"""
+        cache_key = _llm_cache_key("factcheck:", f"{claim}|{self.model}")
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
 
         try:
-            if self.provider == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=500,
-                    messages=[{"role": "user", "content": prompt}],
-                )
-                content = response.content[0].text
-            else:
-                response = openai.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=500,
-                    temperature=0.3,
-                )
-                content = response.choices[0].message.content or "{}"
-
-            return json.loads(content)
+            assessment = orjson.loads(await self._complete_async(prompt, 500) or "{}")
+            await cache_set(cache_key, orjson.dumps(assessment).decode(), _LLM_CACHE_TTL)
+            return assessment
 
         except Exception as e:
             return {
@@ -150,6 +466,53 @@ Respond in JSON:
                 "explanation": f"Error: {str(e)}",
             }
 
+    async def _llm_fact_check_bulk(self, claims: list[str], k: int = 8) -> list[dict[str, Any]]:
+        """Assess many claims, packing K per completion like extract_claims_bulk.
+
+        Packs run concurrently under the shared rate-limit semaphore, so an
+        article's verification costs roughly one round-trip per concurrent
+        pack instead of one per claim.
+        """
+        if not self.enabled or self.provider == "disabled":
+            return [
+                {
+                    "verdict": "needs_verification",
+                    "confidence": 0.0,
+                    "explanation": "LLM fact checking is disabled",
+                    "red_flags": [],
+                    "context_needed": [],
+                }
+                for _ in claims
+            ]
+
+        results: list[dict[str, Any]] = [{} for _ in claims]
+        semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+
+        async def _assess_pack(pack: list[int]) -> None:
+            numbered = "\n".join(
+                f"{position}. {claims[index]}" for position, index in enumerate(pack, 1)
+            )
+            prompt = FACT_CHECK_BULK_TMPL.substitute(claims=numbered)
+
+            try:
+                async with semaphore:
+                    parsed = orjson.loads(
+                        await self._complete_async(prompt, 500 * len(pack)) or "{}"
+                    )
+                for position, index in enumerate(pack, 1):
+                    assessment = parsed.get(str(position), {})
+                    results[index] = assessment if isinstance(assessment, dict) else {}
+            except Exception as e:
+                for index in pack:
+                    results[index] = {
+                        "verdict": "error",
+                        "confidence": 0.0,
+                        "explanation": f"Error: {str(e)}",
+                    }
+
+        await asyncio.gather(*(_assess_pack(pack) for pack in self._pack_items(claims, k)))
+        return results
+
     async def _web_search_verification(self, claim: str) -> list[dict[str, Any]]:
         """Search web for claim verification."""
         # This would integrate with:
@@ -162,36 +525,68 @@ Respond in JSON:
 
         # Example: Use DuckDuckGo or similar
         try:
-            async with httpx.AsyncClient() as client:
-                # Simplified search - in production use proper APIs
-                search_url = f"https://api.duckduckgo.com/?q={claim}&format=json"
-                response = await client.get(search_url, timeout=10.0)
-                if response.status_code == 200:
-                    data = response.json()
-                    # Parse and extract relevant information
-                    sources.append(
-                        {
-                            "source": "DuckDuckGo",
-                            "summary": data.get("Abstract", ""),
-                            "url": data.get("AbstractURL", ""),
-                        }
-                    )
+            # Simplified search - in production use proper APIs
+            search_url = f"https://api.duckduckgo.com/?q={claim}&format=json"
+            response = await get_http_client().get(search_url)
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                # Parse and extract relevant information
+                sources.append(
+                    {
+                        "source": "DuckDuckGo",
+                        "summary": data.get("Abstract", ""),
+                        "url": data.get("AbstractURL", ""),
+                    }
+                )
         except Exception:
             pass
 
         return sources
 
     async def check_article(self, article: Article) -> dict[str, Any]:
-        """Comprehensive fact check of entire article."""
+        """Comprehensive fact check of entire article.
+
+        Reports are persisted to article_factchecks keyed by content hash, so
+        a repeat check of an unchanged article is one SELECT instead of a
+        claim-extraction plus per-claim verification fan-out.
+        """
+        content_hash = None
+        if self.enabled and self.provider != "disabled":
+            content_hash = hashlib.blake2b(
+                self._article_text(article).encode(), digest_size=16
+            ).hexdigest()
+            row = (
+                self.db.query(ArticleFactCheck.payload)
+                .filter(
+                    ArticleFactCheck.article_id == article.id,
+                    ArticleFactCheck.model == self.model,
+                    ArticleFactCheck.content_hash == content_hash,
+                )
+                .scalar()
+            )
+            if row is not None:
+                return row
+
         # Extract claims
         claims = await self.extract_claims(article)
 
-        # Verify each claim
-        verified_claims = []
-        for claim_data in claims:
-            if "claim" in claim_data:
-                verification = await self.verify_claim(claim_data["claim"])
-                verified_claims.append({**claim_data, **verification})
+        # Verify the claims in packed completions: requests-per-minute is the
+        # binding provider limit at this prompt size, so K claims per prompt
+        # beats a fan-out of single-claim calls
+        claim_items = [c for c in claims if "claim" in c]
+        assessments = await self._llm_fact_check_bulk([c["claim"] for c in claim_items])
+
+        verified_claims = [
+            {
+                "verdict": "unknown",
+                "confidence": 0.0,
+                "explanation": "",
+                "sources": [],
+                **claim_data,
+                **assessment,
+            }
+            for claim_data, assessment in zip(claim_items, assessments)
+        ]
 
         # Overall assessment
         total_claims = len(verified_claims)
@@ -202,47 +597,63 @@ Respond in JSON:
                 "claims": [],
             }
 
-        # Calculate reliability score
-        true_count = sum(1 for c in verified_claims if c.get("verdict") == "likely_true")
-        false_count = sum(1 for c in verified_claims if c.get("verdict") == "likely_false")
+        # One pass over the claims; verdict tallies feed the score, the
+        # overall verdict, and the summary without re-scanning the list
+        verdicts = Counter(c.get("verdict", "unknown") for c in verified_claims)
+        true_count = verdicts["likely_true"]
+        false_count = verdicts["likely_false"]
 
         reliability_score = (true_count - false_count * 2) / total_claims
         reliability_score = max(0.0, min(1.0, (reliability_score + 1) / 2))
 
-        return {
-            "overall_verdict": self._calculate_overall_verdict(verified_claims),
+        report = {
+            "overall_verdict": self._calculate_overall_verdict(verdicts, total_claims),
             "reliability_score": reliability_score,
             "total_claims": total_claims,
             "verified_claims": verified_claims,
-            "summary": self._generate_summary(verified_claims),
+            "summary": self._generate_summary(verdicts, total_claims),
         }
 
-    def _calculate_overall_verdict(self, claims: list[dict[str, Any]]) -> str:
-        """Calculate overall verdict from individual claims."""
-        verdicts = [c.get("verdict", "unknown") for c in claims]
-
-        if not verdicts:
+        # Persist only clean reports; error verdicts stay retryable
+        if content_hash is not None and verdicts["error"] == 0:
+            self.db.add(
+                ArticleFactCheck(
+                    article_id=article.id,
+                    model=self.model,
+                    content_hash=content_hash,
+                    payload=report,
+                )
+            )
+            try:
+                self.db.commit()
+            except IntegrityError:
+                # A concurrent check persisted the same row first
+                self.db.rollback()
+
+        return report
+
+    def _calculate_overall_verdict(self, verdicts: Counter, total: int) -> str:
+        """Calculate overall verdict from tallied claim verdicts."""
+        if not total:
             return "unknown"
 
-        false_count = verdicts.count("likely_false") + verdicts.count("misleading")
-        total = len(verdicts)
+        false_count = verdicts["likely_false"] + verdicts["misleading"]
 
         if false_count / total > 0.3:
             return "mostly_false"
         elif false_count > 0:
             return "mixed"
-        elif verdicts.count("likely_true") / total > 0.7:
+        elif verdicts["likely_true"] / total > 0.7:
             return "mostly_true"
         else:
             return "uncertain"
 
-    def _generate_summary(self, claims: list[dict[str, Any]]) -> str:
+    def _generate_summary(self, verdicts: Counter, total: int) -> str:
         """Generate summary of fact check results."""
-        if not claims:
+        if not total:
             return "No verifiable claims found."
 
-        true_count = sum(1 for c in claims if c.get("verdict") == "likely_true")
-        false_count = sum(1 for c in claims if c.get("verdict") == "likely_false")
-        misleading_count = sum(1 for c in claims if c.get("verdict") == "misleading")
-
-        return f"Found {len(claims)} claims: {true_count} likely true, {false_count} likely false, {misleading_count} misleading."
+        return (
+            f"Found {total} claims: {verdicts['likely_true']} likely true, "
+            f"{verdicts['likely_false']} likely false, {verdicts['misleading']} misleading."
+        )
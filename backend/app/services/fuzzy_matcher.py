@@ -1,111 +1,187 @@
 """Fuzzy matching for duplicate article detection."""
 
+import hashlib
 import re
-from difflib import SequenceMatcher
 from typing import Any
 
-from sqlalchemy.orm import Session
-
-from app.models.feed import Article
+from datasketch import MinHash, MinHashLSH
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.feed import Article, Feed
+
+# Compiled once; normalization runs per article at ingest and per query text
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+    }
+)
+# ASCII punctuation -> space translation table; str.translate is a single C
+# pass, used as a fast path when the text has no non-ASCII characters
+_ASCII_PUNCT_TABLE = str.maketrans(
+    {ch: " " for ch in map(chr, range(128)) if not (ch.isalnum() or ch.isspace() or ch == "_")}
+)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for comparison.
+
+    Module-level so ingestion can precompute Article.normalized_title with
+    the exact normalization the matcher compares against.
+    """
+    # Convert to lowercase
+    text = text.lower()
+
+    # Strip punctuation; split() below collapses the resulting whitespace
+    if text.isascii():
+        text = text.translate(_ASCII_PUNCT_TABLE)
+    else:
+        text = _NON_WORD_RE.sub(" ", text)
+
+    # Remove common filler words
+    words = [w for w in text.split() if w not in _STOP_WORDS]
+
+    return " ".join(words)
+
+
+_SIMHASH_BITS = 64
+_MASK64 = (1 << 64) - 1
+
+
+def simhash64(text: str) -> int:
+    """64-bit SimHash over the normalized tokens of a text.
+
+    Module-level like normalize_text so ingestion can precompute
+    Article.title_simhash. The value is returned two's-complement signed so it
+    fits a BIGINT column; compare with hamming64, which masks back to 64 bits.
+    """
+    tokens = normalize_text(text).split()
+    if not tokens:
+        return 0
+
+    weights = [0] * _SIMHASH_BITS
+    for token in tokens:
+        token_hash = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+        for bit in range(_SIMHASH_BITS):
+            weights[bit] += 1 if (token_hash >> bit) & 1 else -1
+
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return value - (1 << _SIMHASH_BITS) if value >= (1 << (_SIMHASH_BITS - 1)) else value
+
+
+def hamming64(a: int, b: int) -> int:
+    """Hamming distance between two signed 64-bit simhashes."""
+    # int.bit_count compiles to POPCNT; the mask undoes the signed storage
+    return ((a ^ b) & _MASK64).bit_count()
 
 
 class FuzzyMatcher:
     """Fuzzy matching service for duplicate detection."""
 
+    # Titles within ~12 differing simhash bits are plausibly similar; larger
+    # distances never survive the 0.8 ratio threshold in practice
+    _SIMHASH_MAX_HAMMING = 12
+
     def __init__(self, db: Session):
         """Initialize fuzzy matcher."""
         self.db = db
 
     def normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove special characters and extra whitespace
-        text = re.sub(r"[^\w\s]", " ", text)
-        text = re.sub(r"\s+", " ", text)
-
-        # Remove common filler words
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-        }
-        words = text.split()
-        words = [w for w in words if w not in stop_words]
-
-        return " ".join(words).strip()
+        return normalize_text(text)
 
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts (0-1)."""
         norm1 = self.normalize_text(text1)
         norm2 = self.normalize_text(text2)
 
-        # Use SequenceMatcher for fuzzy comparison
-        return SequenceMatcher(None, norm1, norm2).ratio()
-
-    def levenshtein_distance(self, s1: str, s2: str) -> int:
-        """Calculate Levenshtein distance between two strings."""
-        if len(s1) < len(s2):
-            return self.levenshtein_distance(s2, s1)
+        # rapidfuzz runs the comparison in C instead of Python bytecode
+        return fuzz.ratio(norm1, norm2) / 100.0
 
-        if len(s2) == 0:
-            return len(s1)
+    def levenshtein_distance(self, s1: str, s2: str, max_distance: int | None = None) -> int:
+        """Calculate Levenshtein distance between two strings.
 
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                # Cost of insertions, deletions, or substitutions
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
+        Delegates to rapidfuzz's C implementation; max_distance lets bounded
+        checks bail out early via the banded algorithm.
+        """
+        return Levenshtein.distance(s1, s2, score_cutoff=max_distance)
 
     def find_similar_headlines(
         self, article: Article, threshold: float = 0.8, limit: int = 10
     ) -> list[tuple[Article, float]]:
         """Find articles with similar headlines."""
-        # Get recent articles from the same user
+        # Get recent articles from the same user. The explicit join filters on
+        # Feed.user_id directly instead of a correlated has() subquery, and
+        # selectinload batches the feed rows into one extra SELECT rather than
+        # one lazy load per article
         recent_articles = (
             self.db.query(Article)
-            .join(Article.feed)
+            .join(Feed, Article.feed_id == Feed.id)
+            .options(selectinload(Article.feed))
             .filter(
                 Article.id != article.id,
-                Article.feed.has(user_id=article.feed.user_id),
+                Feed.user_id == article.feed.user_id,
             )
             .order_by(Article.created_at.desc())
             .limit(1000)  # Check last 1000 articles
             .all()
         )
 
-        similar_articles = []
-
-        for other_article in recent_articles:
-            similarity = self.calculate_similarity(article.title, other_article.title)
-
-            if similarity >= threshold:
-                similar_articles.append((other_article, similarity))
+        if not recent_articles:
+            return []
 
-        # Sort by similarity
-        similar_articles.sort(key=lambda x: x[1], reverse=True)
+        # SimHash prefilter: candidates whose title simhash differs by more
+        # than _SIMHASH_MAX_HAMMING bits cannot score near the threshold, so
+        # they are rejected with an XOR + popcount before any string compare.
+        # Legacy rows without a simhash fall through to the full scan.
+        query_hash = (
+            article.title_simhash if article.title_simhash is not None else simhash64(article.title)
+        )
+        recent_articles = [
+            a
+            for a in recent_articles
+            if a.title_simhash is None
+            or hamming64(query_hash, a.title_simhash) <= self._SIMHASH_MAX_HAMMING
+        ]
+        if not recent_articles:
+            return []
+
+        # One process.extract call scans every candidate in C with the score
+        # cutoff applied early, instead of a Python loop of ratio() calls.
+        # Titles normalized at ingest are reused; older rows without one are
+        # normalized on the fly.
+        articles_by_id = {a.id: a for a in recent_articles}
+        choices = {
+            a.id: a.normalized_title or self.normalize_text(a.title) for a in recent_articles
+        }
+        matches = process.extract(
+            article.normalized_title or self.normalize_text(article.title),
+            choices,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold * 100,
+            limit=limit,
+        )
 
-        return similar_articles[:limit]
+        return [(articles_by_id[article_id], score / 100.0) for _, score, article_id in matches]
 
     def find_duplicates(
         self, article: Article, title_threshold: float = 0.85, content_threshold: float = 0.9
@@ -143,26 +219,106 @@ class FuzzyMatcher:
 
         return duplicates
 
+    # MinHash-LSH parameters: permutations per sketch and the Jaccard
+    # threshold at which two articles land in the same candidate bucket
+    _LSH_NUM_PERM = 64
+    _LSH_THRESHOLD = 0.7
+
+    def _keyword_minhash(self, text: str) -> MinHash:
+        """Build a MinHash sketch over a text's keyword set."""
+        minhash = MinHash(num_perm=self._LSH_NUM_PERM)
+        for keyword in self.extract_keywords(text):
+            minhash.update(keyword.encode())
+        return minhash
+
+    def _score_candidates(
+        self,
+        article: Article,
+        candidates: list[Article],
+        title_threshold: float = 0.85,
+        content_threshold: float = 0.9,
+    ) -> list[dict[str, Any]]:
+        """Score candidate articles against one article, same shape as find_duplicates."""
+        duplicates = []
+        title_norm = article.normalized_title or self.normalize_text(article.title)
+        query_hash = (
+            article.title_simhash if article.title_simhash is not None else simhash64(article.title)
+        )
+
+        for other_article in candidates:
+            # Popcount prefilter: titles too many simhash bits apart cannot
+            # reach the ratio threshold, so the per-pair cost in the dedup
+            # batch loop drops to an XOR + bit_count for most candidates.
+            # Content similarity below can still mark such pairs duplicates.
+            if (
+                other_article.title_simhash is not None
+                and hamming64(query_hash, other_article.title_simhash) > self._SIMHASH_MAX_HAMMING
+            ):
+                title_similarity = 0.0
+            else:
+                other_norm = other_article.normalized_title or self.normalize_text(
+                    other_article.title
+                )
+                title_similarity = fuzz.ratio(title_norm, other_norm) / 100.0
+
+            content_similarity = 0.0
+            if article.content and other_article.content:
+                content_similarity = self.calculate_similarity(
+                    article.content[:500], other_article.content[:500]
+                )
+
+            if title_similarity >= title_threshold or content_similarity >= content_threshold:
+                duplicates.append(
+                    {
+                        "article_id": other_article.id,
+                        "article_title": other_article.title,
+                        "title_similarity": title_similarity,
+                        "content_similarity": content_similarity,
+                        "feed_id": other_article.feed_id,
+                        "published_date": other_article.published_date,
+                    }
+                )
+
+        return duplicates
+
     def deduplicate_articles(self, user_id: int, keep_strategy: str = "oldest") -> dict[str, Any]:
         """Deduplicate articles for a user."""
-        # Get all articles
-        articles = (
+        # Get all articles; yield_per streams rows in batches so the fetch
+        # doesn't buffer the whole corpus twice
+        articles = list(
             self.db.query(Article)
-            .join(Article.feed)
-            .filter(Article.feed.has(user_id=user_id))
+            .join(Feed, Article.feed_id == Feed.id)
+            .options(selectinload(Article.feed))
+            .filter(Feed.user_id == user_id)
             .order_by(Article.created_at.asc())
-            .all()
+            .yield_per(500)
         )
 
+        # LSH blocking: each article is only scored against its bucket of
+        # likely-similar candidates instead of the whole corpus, replacing the
+        # O(N^2) similarity matrix with O(N * bucket)
+        lsh = MinHashLSH(threshold=self._LSH_THRESHOLD, num_perm=self._LSH_NUM_PERM)
+        minhashes = {}
+        articles_by_id = {a.id: a for a in articles}
+        for candidate in articles:
+            minhash = self._keyword_minhash(candidate.title)
+            minhashes[candidate.id] = minhash
+            lsh.insert(str(candidate.id), minhash)
+
         marked_for_removal = set()
         duplicate_groups = []
 
         # Find duplicate groups
-        for i, article in enumerate(articles):
+        for article in articles:
             if article.id in marked_for_removal:
                 continue
 
-            duplicates = self.find_duplicates(article)
+            candidate_ids = [
+                int(key) for key in lsh.query(minhashes[article.id]) if int(key) != article.id
+            ]
+            duplicates = self._score_candidates(
+                article, [articles_by_id[candidate_id] for candidate_id in candidate_ids]
+            )
             if duplicates:
                 group = {"primary": article.id, "duplicates": []}
 
@@ -2,13 +2,45 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+from string import Template
 from typing import Any
 
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache_get, cache_set
 from app.core.config import settings
-from app.models.feed import Article
+from app.models.feed import Article, ArticleInsight
+
+# Articles re-fetched with unchanged text hash to the same key, so repeat
+# insight requests skip the completion entirely for a week
+_INSIGHT_CACHE_TTL = 7 * 86400
+
+# Compiled once at import; generate_insights substitutes only the article text
+INSIGHTS_TMPL = Template(
+    """
+You are assisting a news analyst. Read the article below and respond in JSON.
+
+Article:
+$article_context
+
+Return JSON with the following fields:
+- summary: A concise 3-4 sentence summary tailored for busy professionals.
+- key_points: Array of 3-5 bullet points highlighting facts or implications.
+- reliability_score: Float 0.0-1.0 indicating likely reliability.
+- reliability_label: One of ["Highly Reliable", "Reliable", "Mixed Signals", "Unverified", "Questionable"].
+- reliability_reason: Short justification referencing sourcing, tone, or factual grounding.
+- tone: Qualitative assessment of tone (e.g., "neutral analysis", "strong opinion").
+- suggested_actions: Array of up to 3 actionable follow-ups (can be empty).
+
+Ensure the response is valid JSON.
+"""
+)
 
 
 class LLMFeatureDisabledError(RuntimeError):
@@ -26,57 +58,89 @@ class LLMInsightService:
         """Initialize the service."""
         self.enabled = settings.ENABLE_LLM_FEATURES and bool(settings.OPENAI_API_KEY)
         self.model = settings.LLM_MODEL_OPENAI
-        self.client: OpenAI | None = None
+        self.client: AsyncOpenAI | None = None
 
         if self.enabled:
-            self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
     def _ensure_enabled(self) -> None:
         if not self.enabled:
             raise LLMFeatureDisabledError("LLM features are disabled")
 
-    def generate_insights(self, article: Article) -> dict[str, Any]:
-        """Generate structured insights for an article."""
+    def _content_hash(self, article: Article) -> str:
+        """Digest of the prompt-determining article text and model."""
+        digest_source = (
+            f"{article.title}|{article.description or ''}|" f"{article.content or ''}|{self.model}"
+        )
+        return hashlib.blake2b(digest_source.encode(), digest_size=16).hexdigest()
+
+    def _cache_key(self, article: Article) -> str:
+        """Key insights by a digest of the article text and model."""
+        return "insight:" + self._content_hash(article)
+
+    async def generate_insights(
+        self, article: Article, db: AsyncSession | None = None
+    ) -> dict[str, Any]:
+        """Generate structured insights for an article.
+
+        With a session the result is read through a two-tier store:
+        L1 Redis, L2 the article_insights table keyed by content hash, so an
+        unchanged article only ever pays for one completion.
+        """
         self._ensure_enabled()
 
+        # Breaking-news items often arrive as a bare headline; a ~400-token
+        # round trip adds nothing there, so answer from heuristics directly
+        body_len = len((article.content or "") + (article.description or ""))
+        if body_len < 200:
+            return self._fallback_insights(article, error="insufficient_content")
+
+        content_hash = self._content_hash(article)
+        cache_key = "insight:" + content_hash
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        if db is not None:
+            row = (
+                await db.execute(
+                    select(ArticleInsight.payload).where(
+                        ArticleInsight.article_id == article.id,
+                        ArticleInsight.model == self.model,
+                        ArticleInsight.content_hash == content_hash,
+                    )
+                )
+            ).scalar_one_or_none()
+            if row is not None:
+                payload: dict[str, Any] = row
+                await cache_set(cache_key, orjson.dumps(payload).decode(), _INSIGHT_CACHE_TTL)
+                return payload
+
         text_chunks = [f"Title: {article.title}"]
         if article.description:
             text_chunks.append(f"Description: {article.description}")
         if article.content:
-            clean_content = article.content.replace("\n", " ").strip()
+            # Slice before cleaning: replace/strip over a 50 KB body would
+            # copy the whole string only to keep the first 1500 chars
+            clean_content = article.content[:1600].replace("\n", " ").strip()
             if len(clean_content) > 1500:
                 clean_content = clean_content[:1500] + "..."
             text_chunks.append(f"Body: {clean_content}")
 
-        article_context = "\n".join(text_chunks)
-
-        prompt = f"""
-You are assisting a news analyst. Read the article below and respond in JSON.
-
-Article:
-{article_context}
-
-Return JSON with the following fields:
-- summary: A concise 3-4 sentence summary tailored for busy professionals.
-- key_points: Array of 3-5 bullet points highlighting facts or implications.
-- reliability_score: Float 0.0-1.0 indicating likely reliability.
-- reliability_label: One of ["Highly Reliable", "Reliable", "Mixed Signals", "Unverified", "Questionable"].
-- reliability_reason: Short justification referencing sourcing, tone, or factual grounding.
-- tone: Qualitative assessment of tone (e.g., "neutral analysis", "strong opinion").
-- suggested_actions: Array of up to 3 actionable follow-ups (can be empty).
-
-Ensure the response is valid JSON.
-"""
+        prompt = INSIGHTS_TMPL.substitute(article_context="\n".join(text_chunks))
 
         try:
             if not self.client:
                 raise LLMContentError("LLM client not initialized")
 
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=400,
                 temperature=0.3,
+                # JSON mode: the model only emits valid JSON, so the parse
+                # below effectively cannot fall back for malformed output
+                response_format={"type": "json_object"},
             )
             content = response.choices[0].message.content if response.choices else None
         except Exception as exc:  # pragma: no cover - network failure
@@ -86,11 +150,12 @@ Ensure the response is valid JSON.
             return self._fallback_insights(article, error="empty_response")
 
         try:
-            parsed = json.loads(content)
-        except json.JSONDecodeError:
+            # orjson parses in C; visible when insights run over whole feeds
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError:
             return self._fallback_insights(article, error="invalid_json")
 
-        return {
+        insights = {
             "summary": parsed.get("summary", "") or self._build_summary(article),
             "key_points": parsed.get("key_points", []) or self._build_key_points(article),
             "reliability_score": parsed.get(
@@ -105,6 +170,53 @@ Ensure the response is valid JSON.
             or self._suggest_actions(article),
         }
 
+        # Only successful LLM results are cached; fallbacks stay retryable
+        await cache_set(cache_key, orjson.dumps(insights).decode(), _INSIGHT_CACHE_TTL)
+        if db is not None:
+            db.add(
+                ArticleInsight(
+                    article_id=article.id,
+                    model=self.model,
+                    content_hash=content_hash,
+                    payload=insights,
+                )
+            )
+            try:
+                await db.commit()
+            except IntegrityError:
+                # A concurrent request persisted the same row first
+                await db.rollback()
+        return insights
+
+    async def generate_insights_many(
+        self, articles: list[Article], concurrency: int = 10
+    ) -> list[dict[str, Any]]:
+        """Generate insights for many articles concurrently.
+
+        Fans out one network-bound call per article behind a semaphore, so a
+        feed-sized batch takes roughly the latency of its slowest article;
+        results align with the input order and failures fall back per article.
+        """
+        self._ensure_enabled()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(article: Article) -> dict[str, Any]:
+            async with semaphore:
+                return await self.generate_insights(article)
+
+        results = await asyncio.gather(
+            *[_one(article) for article in articles], return_exceptions=True
+        )
+        return [
+            (
+                self._fallback_insights(article, error=str(result))
+                if isinstance(result, Exception)
+                else result
+            )
+            for article, result in zip(articles, results)
+        ]
+
     def _fallback_insights(self, article: Article, error: str | None = None) -> dict[str, Any]:
         score = self._estimate_reliability(article)
         return {
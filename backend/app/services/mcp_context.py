@@ -1,18 +1,31 @@
 """MCP (Model Context Protocol) integration for enhanced context."""
 
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
-from pydantic import BaseModel
+# Fetches all four history attributes in one C-level call per article
+_history_getter = attrgetter("title", "topics", "user_rating", "sentiment_score")
 
 
-class MCPContext(BaseModel):
-    """MCP context for LLM interactions."""
+@dataclass(slots=True, frozen=True)
+class MCPContext:
+    """MCP context for LLM interactions.
+
+    Built from already-trusted DB rows once per recommendation request, so a
+    plain slotted dataclass avoids pydantic's per-field validation and the
+    per-instance __dict__.
+    """
 
     user_id: int
     reading_history: list[dict[str, Any]]
     preferences: dict[str, Any]
     current_trends: list[str]
-    semantic_clusters: dict[int, list[dict[str, Any]]]
+    # Parallel per-cluster arrays (index-aligned) instead of one dict per
+    # article: two appends into hot lists rather than a dict allocation each
+    cluster_titles: dict[int, list[str]]
+    cluster_topics: dict[int, list[list[str]]]
 
 
 class MCPContextBuilder:
@@ -30,15 +43,11 @@ class MCPContextBuilder:
         articles: list[Any],
     ) -> MCPContext:
         """Build comprehensive context for LLM recommendations."""
-        # Extract reading patterns
+        # Extract reading patterns; map(_history_getter, ...) pulls the four
+        # attributes per article without repeated bytecode-level lookups
         history_data = [
-            {
-                "title": article.title,
-                "topics": article.topics or [],
-                "rating": article.user_rating,
-                "sentiment": article.sentiment_score,
-            }
-            for article in reading_history
+            {"title": title, "topics": topics or [], "rating": rating, "sentiment": sentiment}
+            for title, topics, rating, sentiment in map(_history_getter, reading_history)
         ]
 
         # Build preference map
@@ -48,34 +57,29 @@ class MCPContextBuilder:
             "min_relevance": preferences.min_relevance_score if preferences else 0.5,
         }
 
-        # Identify trending topics from recent articles
-        all_topics: list[str] = []
+        # One pass over the articles: topic counts for trending (Counter.update
+        # counts in C) and cluster grouping, instead of separate walks with an
+        # intermediate all-topics list
+        topic_counts: Counter[str] = Counter()
+        cluster_titles: defaultdict[int, list[str]] = defaultdict(list)
+        cluster_topics: defaultdict[int, list[list[str]]] = defaultdict(list)
         for article in articles:
             if article.topics:
-                all_topics.extend(article.topics)
-
-        # Get top 10 most common topics
-        from collections import Counter
+                topic_counts.update(article.topics)
+            if article.cluster_id is not None:
+                cluster_titles[article.cluster_id].append(article.title)
+                cluster_topics[article.cluster_id].append(article.topics or [])
 
-        topic_counts = Counter(all_topics)
+        # Top 10 most common topics
         trending = [topic for topic, _ in topic_counts.most_common(10)]
 
-        # Group articles by cluster
-        clusters: dict[int, list[dict[str, Any]]] = {}
-        for article in articles:
-            if article.cluster_id is not None:
-                if article.cluster_id not in clusters:
-                    clusters[article.cluster_id] = []
-                clusters[article.cluster_id].append(
-                    {"title": article.title, "topics": article.topics or []}
-                )
-
         return MCPContext(
             user_id=user_id,
             reading_history=history_data,
             preferences=preference_data,
             current_trends=trending,
-            semantic_clusters=clusters,
+            cluster_titles=dict(cluster_titles),
+            cluster_topics=dict(cluster_topics),
         )
 
     def format_for_llm(self, context: MCPContext) -> str:
@@ -99,7 +103,7 @@ class MCPContextBuilder:
         if context.current_trends:
             parts.append(f"\nTrending Topics: {', '.join(context.current_trends[:5])}")
 
-        if context.semantic_clusters:
-            parts.append(f"\nIdentified {len(context.semantic_clusters)} semantic clusters")
+        if context.cluster_titles:
+            parts.append(f"\nIdentified {len(context.cluster_titles)} semantic clusters")
 
         return "\n".join(parts)
@@ -1,10 +1,14 @@
 """NLP processing service for article clustering and semantic analysis."""
 
+import hashlib
+import logging
 import math
 import re
+import threading
 from collections import Counter
 
 import numpy as np
+from cachetools import LRUCache
 from sentence_transformers import SentenceTransformer
 from sklearn.cluster import DBSCAN
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -16,6 +20,72 @@ from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from app.core.config import settings
 from app.models.feed import Article
 
+logger = logging.getLogger(__name__)
+
+# Content-hash keyed embedding cache shared across processor instances: the
+# model forward pass dominates processing time, and articles are re-visited
+# whenever any derived field (e.g. writing_style) is missing, so identical
+# text should never hit the transformer twice
+_EMBEDDING_CACHE: LRUCache = LRUCache(maxsize=2048)
+_embedding_cache_lock = threading.Lock()
+
+
+def _text_digest(text: str) -> str:
+    """Stable cache key for a piece of text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class _OnnxEncoder:
+    """Sentence encoder served through ONNX Runtime.
+
+    Exposes the same encode() surface the call sites use (list or single
+    string, batch_size, normalize_embeddings) so it can stand in for
+    SentenceTransformer when the optional optimum[onnxruntime] extra is
+    installed. Graph optimizations are applied by optimum at export time.
+    """
+
+    def __init__(self, model_name: str) -> None:
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        # SentenceTransformer resolves bare names against its own hub
+        # namespace; transformers needs the fully qualified repo id
+        hf_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        self.tokenizer = AutoTokenizer.from_pretrained(hf_id)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(hf_id, export=True)
+
+    def encode(
+        self,
+        texts: str | list[str],
+        batch_size: int = 64,
+        normalize_embeddings: bool = False,
+        **_: object,
+    ) -> np.ndarray:
+        """Encode text via the ONNX session with mean pooling."""
+        single = isinstance(texts, str)
+        batch_texts = [texts] if isinstance(texts, str) else texts
+
+        chunks = []
+        for start in range(0, len(batch_texts), batch_size):
+            batch = self.tokenizer(
+                batch_texts[start : start + batch_size],
+                padding=True,
+                truncation=True,
+                return_tensors="np",
+            )
+            hidden = np.asarray(self.model(**batch).last_hidden_state)
+            # Mean pooling over real tokens only
+            mask = batch["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            chunks.append(pooled)
+
+        embeddings = np.vstack(chunks).astype(np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            embeddings /= norms
+        return embeddings[0] if single else embeddings
+
 
 class NLPProcessor:
     """NLP processing service."""
@@ -23,17 +93,66 @@ class NLPProcessor:
     def __init__(self, db: Session) -> None:
         """Initialize NLP processor."""
         self.db = db
-        self.model = SentenceTransformer(settings.SENTENCE_TRANSFORMER_MODEL)
+        self.model = self._load_encoder()
         self.sentiment_analyzer = SentimentIntensityAnalyzer()
         self.nlp = English()
         if "sentencizer" not in self.nlp.pipe_names:
             self.nlp.add_pipe("sentencizer")
 
+    @staticmethod
+    def _load_encoder():
+        """Build the sentence encoder, preferring ONNX Runtime when enabled.
+
+        Any failure (missing optional extra, export error) degrades to the
+        stock SentenceTransformer so processing never hard-fails on setup.
+        """
+        if settings.USE_ONNX_ENCODER:
+            try:
+                return _OnnxEncoder(settings.SENTENCE_TRANSFORMER_MODEL)
+            except Exception as e:
+                logger.warning(
+                    "ONNX encoder unavailable, falling back to SentenceTransformer: %s", e
+                )
+        return SentenceTransformer(settings.SENTENCE_TRANSFORMER_MODEL)
+
     def generate_embedding(self, text: str) -> list[float]:
-        """Generate embedding for text."""
-        embedding = self.model.encode(text)
+        """Generate a unit-length embedding for text.
+
+        Normalizing at encode time means cosine similarity downstream is a
+        plain dot product — no norms or sqrt per comparison. Repeated text is
+        served from the content-hash cache without touching the model.
+        """
+        digest = _text_digest(text)
+        with _embedding_cache_lock:
+            cached = _EMBEDDING_CACHE.get(digest)
+        if cached is not None:
+            return cached.tolist()
+
+        embedding = np.asarray(self.model.encode(text, normalize_embeddings=True))
+        with _embedding_cache_lock:
+            _EMBEDDING_CACHE[digest] = embedding
         return embedding.tolist()
 
+    @staticmethod
+    def _embedding_array(article: Article) -> np.ndarray:
+        """Decode an article's stored embedding as a float32 vector.
+
+        Prefers the raw-bytes column (a single zero-copy frombuffer) and falls
+        back to parsing the JSON text for rows written before embedding_blob
+        existed. The result is always unit-length: blobs are written
+        normalized, and the legacy fallback normalizes after parsing.
+        """
+        import orjson
+
+        if article.embedding_blob is not None:
+            return np.frombuffer(article.embedding_blob, dtype=np.float32)
+        if isinstance(article.embedding, str):
+            vector = np.asarray(orjson.loads(article.embedding), dtype=np.float32)
+        else:
+            vector = np.asarray(article.embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
     def process_article(self, article: Article) -> None:
         """Process single article for NLP features."""
         import json
@@ -41,9 +160,11 @@ class NLPProcessor:
         # Combine title and description for embedding
         text = f"{article.title}. {article.description or ''}"
 
-        # Generate embedding (store as JSON string for SQLite compatibility)
+        # Generate embedding; JSON text is kept for compatibility, the float32
+        # bytes are what the read paths prefer
         embedding = self.generate_embedding(text)
         article.embedding = json.dumps(embedding)
+        article.embedding_blob = np.asarray(embedding, dtype=np.float32).tobytes()
 
         # Extract topics and categories (model auto-converts to JSON)
         topics = self._extract_topics(text)
@@ -77,15 +198,44 @@ class NLPProcessor:
             .all()
         )
 
+        # Combine title and description for embedding
+        texts = [f"{article.title}. {article.description or ''}" for article in articles]
+
+        # Serve repeats from the content-hash cache, then encode the misses in
+        # one model call instead of one forward pass per article; visiting
+        # texts in length order keeps each padding batch tight, so short texts
+        # are not padded up to the longest in the set
+        digests = [_text_digest(text) for text in texts]
+        vectors: dict[int, np.ndarray] = {}
+        with _embedding_cache_lock:
+            for i, digest in enumerate(digests):
+                cached = _EMBEDDING_CACHE.get(digest)
+                if cached is not None:
+                    vectors[i] = cached
+        misses = sorted(
+            (i for i in range(len(texts)) if i not in vectors), key=lambda i: len(texts[i])
+        )
+        if misses:
+            encoded = self.model.encode(
+                [texts[i] for i in misses],
+                batch_size=64,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+            with _embedding_cache_lock:
+                for i, vector in zip(misses, encoded):
+                    vectors[i] = vector
+                    _EMBEDDING_CACHE[digests[i]] = vector
+
         processed = 0
-        for article in articles:
+        for idx, embedding in vectors.items():
+            article = articles[idx]
+            text = texts[idx]
             try:
-                # Combine title and description for embedding
-                text = f"{article.title}. {article.description or ''}"
-
-                # Generate embedding (store as JSON string for SQLite compatibility)
-                embedding = self.generate_embedding(text)
-                article.embedding = json.dumps(embedding)
+                # JSON text kept for compatibility; float32 bytes for readers
+                article.embedding = json.dumps(np.asarray(embedding).tolist())
+                article.embedding_blob = np.asarray(embedding, dtype=np.float32).tobytes()
 
                 # Extract topics and categories (model auto-converts to JSON)
                 topics = self._extract_topics(text)
@@ -100,12 +250,12 @@ class NLPProcessor:
 
                 processed += 1
 
-                # Commit in batches of 10 to avoid memory issues
-                if processed % 10 == 0:
+                # Commit in batches to avoid memory issues
+                if processed % 64 == 0:
                     self.db.commit()
 
             except Exception as e:
-                print(f"Error processing article {article.id}: {e}")
+                logger.warning("Error processing article %s: %s", article.id, e)
                 continue
 
         # Final commit
@@ -119,8 +269,6 @@ class NLPProcessor:
 
     def cluster_articles(self, user_id: int, min_samples: int | None = None) -> int:
         """Cluster articles using DBSCAN on embeddings."""
-        import json
-
         if min_samples is None:
             min_samples = settings.CLUSTERING_MIN_SAMPLES
 
@@ -138,18 +286,18 @@ class NLPProcessor:
         if len(articles) < min_samples:
             return 0
 
-        # Extract embeddings (parse JSON strings)
-        embeddings = []
-        for article in articles:
-            if isinstance(article.embedding, str):
-                embeddings.append(json.loads(article.embedding))
-            else:
-                embeddings.append(article.embedding)
-
-        embeddings = np.array(embeddings)
-
-        # Perform clustering
-        clustering = DBSCAN(eps=0.5, min_samples=min_samples, metric="cosine")
+        # Decode straight into one preallocated float32 matrix: each row is
+        # written in place, so there is no intermediate list of arrays and no
+        # second copy inside a stack call
+        first = self._embedding_array(articles[0])
+        embeddings = np.empty((len(articles), first.shape[0]), dtype=np.float32)
+        embeddings[0] = first
+        for i, article in enumerate(articles[1:], start=1):
+            embeddings[i] = self._embedding_array(article)
+
+        # On unit vectors ||a-b||^2 = 2(1 - cos), so euclidean eps=1.0 matches
+        # the old cosine-distance eps=0.5 with a cheaper inner loop
+        clustering = DBSCAN(eps=1.0, min_samples=min_samples, metric="euclidean")
         labels = clustering.fit_predict(embeddings)
 
         # Update cluster IDs
@@ -163,9 +311,7 @@ class NLPProcessor:
         self, article: Article, limit: int = 10, threshold: float = 0.7
     ) -> list[tuple[Article, float]]:
         """Find similar articles based on embedding similarity."""
-        import json
-
-        if not article.embedding:
+        if article.embedding is None and article.embedding_blob is None:
             return []
 
         # Get other articles with embeddings
@@ -179,32 +325,22 @@ class NLPProcessor:
             .all()
         )
 
-        # Parse article embedding
-        if isinstance(article.embedding, str):
-            article_embedding = np.array(json.loads(article.embedding))
-        else:
-            article_embedding = np.array(article.embedding)
-
-        similarities: list[tuple[Article, float]] = []
-
-        for other in articles:
-            # Parse other embedding
-            if isinstance(other.embedding, str):
-                other_embedding = np.array(json.loads(other.embedding))
-            else:
-                other_embedding = np.array(other.embedding)
+        if not articles:
+            return []
 
-            similarity = float(
-                np.dot(article_embedding, other_embedding)
-                / (np.linalg.norm(article_embedding) * np.linalg.norm(other_embedding))
-            )
+        query = self._embedding_array(article)
+        if not query.any():
+            return []
 
-            if similarity >= threshold:
-                similarities.append((other, similarity))
+        # Stored vectors are unit-length, so one matrix-vector product yields
+        # every cosine similarity — no norms or divisions per candidate
+        matrix = np.stack([self._embedding_array(other) for other in articles])
+        sims = matrix @ query
 
-        # Sort by similarity and return top N
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:limit]
+        # Threshold, then sort only the survivors by descending similarity
+        idx = np.where(sims >= threshold)[0]
+        idx = idx[np.argsort(-sims[idx])][:limit]
+        return [(articles[i], float(sims[i])) for i in idx]
 
     def _calculate_readability(self, text: str) -> tuple[float | None, str | None]:
         """Calculate readability score and label using textstat."""
@@ -5,12 +5,17 @@ import json
 import anthropic
 import numpy as np
 import openai
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import settings
 from app.models.feed import Article, UserPreference
 
 
+def _topic_set(values) -> set[str]:
+    """Coerce a JSON-encoded topics column value to a set of strings."""
+    return set(values) if isinstance(values, list) else set()
+
+
 class RecommendationEngine:
     """LLM-powered recommendation engine."""
 
@@ -46,7 +51,8 @@ class RecommendationEngine:
         if not preferences or not preferences.enable_recommendations:
             return []
 
-        # Get unread articles
+        # Get unread articles; batch-load feeds so later feed access is one
+        # SELECT ... IN (...) instead of a lazy query per article
         unread_articles = (
             self.db.query(Article)
             .join(Article.feed)
@@ -55,6 +61,7 @@ class RecommendationEngine:
                 Article.is_read.is_(False),
                 Article.embedding.isnot(None),
             )
+            .options(selectinload(Article.feed))
             .limit(100)
             .all()
         )
@@ -71,6 +78,7 @@ class RecommendationEngine:
                 Article.is_read.is_(True),
                 Article.user_rating.isnot(None),
             )
+            .options(selectinload(Article.feed))
             .order_by(Article.user_rating.desc())
             .limit(10)
             .all()
@@ -203,16 +211,16 @@ Respond in JSON format:
 
         # Topic-based scoring if user has preferences
         if article.topics and preferences.preferred_topics:
-            article_topics = set(article.topics) if isinstance(article.topics, list) else set()
-            preferred_topics = set(preferences.preferred_topics)
+            article_topics = _topic_set(article.topics)
+            preferred_topics = _topic_set(preferences.preferred_topics)
             topic_overlap = len(article_topics & preferred_topics)
             if topic_overlap > 0:
                 base_score += 0.2 * topic_overlap  # Boost for matching preferred topics
 
         # Penalize excluded topics
         if article.topics and preferences.excluded_topics:
-            article_topics = set(article.topics) if isinstance(article.topics, list) else set()
-            excluded_topics = set(preferences.excluded_topics)
+            article_topics = _topic_set(article.topics)
+            excluded_topics = _topic_set(preferences.excluded_topics)
             if article_topics & excluded_topics:
                 base_score -= 0.3  # Penalize excluded topics
 
@@ -1,6 +1,7 @@
 """RSS feed fetching and parsing service."""
 
 import asyncio
+import logging
 import re
 from datetime import datetime
 from typing import Any
@@ -11,6 +12,13 @@ from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 
 from app.models.feed import Article, Feed
+from app.services.fuzzy_matcher import normalize_text, simhash64
+
+logger = logging.getLogger(__name__)
+
+# Caps for bulk refresh: total in-flight fetches and connections per host
+MAX_CONCURRENT_FETCHES = 16
+MAX_CONNECTIONS_PER_HOST = 4
 
 
 class RSSFetcher:
@@ -47,11 +55,21 @@ class RSSFetcher:
 
         return cleaned.strip()
 
-    async def fetch_feed(self, feed_url: str) -> dict[str, Any]:
-        """Fetch and parse RSS feed."""
-        async with aiohttp.ClientSession() as session:
+    async def fetch_feed(
+        self, feed_url: str, session: aiohttp.ClientSession | None = None
+    ) -> dict[str, Any]:
+        """Fetch and parse RSS feed.
+
+        A shared ClientSession can be passed in so bulk refreshes reuse pooled
+        connections; without one, a session is created for the single fetch.
+        """
+        if session is not None:
             async with session.get(str(feed_url)) as response:
                 content = await response.text()
+        else:
+            async with aiohttp.ClientSession() as own_session:
+                async with own_session.get(str(feed_url)) as response:
+                    content = await response.text()
 
         feed_data = feedparser.parse(content)
         return {
@@ -60,10 +78,12 @@ class RSSFetcher:
             "entries": feed_data.entries,
         }
 
-    async def update_feed(self, feed: Feed) -> list[Article]:
+    async def update_feed(
+        self, feed: Feed, session: aiohttp.ClientSession | None = None
+    ) -> list[Article]:
         """Fetch and update articles for a feed."""
         try:
-            feed_data = await self.fetch_feed(feed.url)
+            feed_data = await self.fetch_feed(feed.url, session)
 
             # Update feed metadata
             if not feed.title and feed_data["title"]:
@@ -74,32 +94,58 @@ class RSSFetcher:
             feed.last_fetched = datetime.utcnow()
             self.db.commit()
 
-            # Process articles
-            new_articles = []
+            # Collect parsed entries, then ingest the whole batch with one
+            # INSERT .. ON CONFLICT (link) DO NOTHING .. RETURNING; the unique
+            # link index arbitrates duplicates in a single round-trip instead
+            # of an existence check plus insert per entry
+            rows = []
+            seen_links: set[str] = set()
             for entry in feed_data["entries"]:
-                # Check if article already exists
-                existing = self.db.query(Article).filter(Article.link == entry.get("link")).first()
-
-                if not existing:
-                    # Clean HTML from description and content
-                    description = self.clean_html(entry.get("summary", ""))
-                    content = None
-                    if entry.get("content"):
-                        content = self.clean_html(entry.get("content", [{}])[0].get("value", ""))
-
-                    article = Article(
-                        feed_id=feed.id,
-                        title=entry.get("title", ""),
-                        link=entry.get("link", ""),
-                        description=description,
-                        content=content,
-                        author=entry.get("author", ""),
-                        published_date=self._parse_date(entry.get("published")),
-                    )
-                    self.db.add(article)
-                    new_articles.append(article)
-
-            self.db.commit()
+                link = entry.get("link", "")
+                if not link or link in seen_links:
+                    continue
+                seen_links.add(link)
+
+                # Clean HTML from description and content
+                description = self.clean_html(entry.get("summary", ""))
+                content = None
+                if entry.get("content"):
+                    content = self.clean_html(entry.get("content", [{}])[0].get("value", ""))
+
+                title = entry.get("title", "")
+                rows.append(
+                    {
+                        "feed_id": feed.id,
+                        "title": title,
+                        # Precomputed once here so duplicate scans never
+                        # re-normalize stored titles
+                        "normalized_title": normalize_text(title),
+                        "title_simhash": simhash64(title),
+                        "link": link,
+                        "description": description,
+                        "content": content,
+                        "author": entry.get("author", ""),
+                        "published_date": self._parse_date(entry.get("published")),
+                    }
+                )
+
+            new_articles: list[Article] = []
+            if rows:
+                if self.db.get_bind().dialect.name == "postgresql":
+                    from sqlalchemy.dialects.postgresql import insert as dialect_insert
+                else:
+                    from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+                stmt = (
+                    dialect_insert(Article)
+                    .on_conflict_do_nothing(index_elements=["link"])
+                    .returning(Article.id)
+                )
+                new_ids = self.db.execute(stmt, rows).scalars().all()
+                self.db.commit()
+
+                if new_ids:
+                    new_articles = self.db.query(Article).filter(Article.id.in_(new_ids)).all()
 
             # Automatically process new articles with NLP
             if new_articles:
@@ -110,7 +156,7 @@ class RSSFetcher:
                     try:
                         processor.process_article(article)
                     except Exception as e:
-                        print(f"Warning: Failed to process article {article.id} with NLP: {e}")
+                        logger.warning("Failed to process article %s with NLP: %s", article.id, e)
 
             return new_articles
 
@@ -125,8 +171,18 @@ class RSSFetcher:
         total_new = 0
         total_errors = 0
 
-        tasks = [self.update_feed(feed) for feed in feeds]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Fan out fetches over one pooled HTTP session; the semaphore bounds
+        # total in-flight requests and the connector caps per-host connections
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        connector = aiohttp.TCPConnector(limit_per_host=MAX_CONNECTIONS_PER_HOST)
+        async with aiohttp.ClientSession(connector=connector) as session:
+
+            async def _update_one(feed: Feed) -> list[Article]:
+                async with semaphore:
+                    return await self.update_feed(feed, session)
+
+            tasks = [_update_one(feed) for feed in feeds]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         for result in results:
             if isinstance(result, Exception):
@@ -142,7 +198,7 @@ class RSSFetcher:
                 processor = NLPProcessor(self.db)
                 processor.cluster_articles(user_id)
             except Exception as e:
-                print(f"Warning: Failed to cluster articles: {e}")
+                logger.warning("Failed to cluster articles: %s", e)
 
         return {"new_articles": total_new, "errors": total_errors, "feeds_updated": len(feeds)}
 
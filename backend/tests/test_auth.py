@@ -1,7 +1,19 @@
 """Test authentication endpoints."""
 
+import base64
+import hashlib
+import hmac
+import json
+from datetime import timedelta
+
+import jwt
+import pytest
 from fastapi.testclient import TestClient
 
+from app.api.deps import _decode_token, _verify_hs256
+from app.core.config import settings
+from app.core.security import create_access_token
+
 
 def test_register_user(client: TestClient):
     """Test user registration - should be disabled."""
@@ -64,3 +76,95 @@ def test_login_missing_credentials(client: TestClient):
         data={},
     )
     assert response.status_code == 422  # Validation error
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def test_verify_hs256_valid_token():
+    """Fast-path verification accepts a token the app issued."""
+    token = create_access_token("42")
+    payload = _verify_hs256(token, settings.SECRET_KEY)
+    assert payload is not None
+    assert payload["sub"] == "42"
+
+
+def test_verify_hs256_agrees_with_pyjwt():
+    """Fast path and PyJWT decode the same token to the same payload."""
+    token = create_access_token("42")
+    fast = _verify_hs256(token, settings.SECRET_KEY)
+    canonical = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    assert fast == canonical
+
+
+def test_verify_hs256_tampered_signature():
+    """A token with a bad signature fails, not falls through to the payload."""
+    header, payload, signature = create_access_token("42").split(".")
+    forged = f"{header}.{payload}." + _b64url(b"\x00" * 32)
+    assert _verify_hs256(forged, settings.SECRET_KEY) is None
+    with pytest.raises(jwt.InvalidTokenError):
+        _decode_token(forged)
+
+
+def test_verify_hs256_tampered_payload():
+    """Editing the payload invalidates the signature."""
+    header, _, signature = create_access_token("42").split(".")
+    forged_payload = _b64url(json.dumps({"sub": "1", "exp": 9999999999}).encode())
+    forged = f"{header}.{forged_payload}.{signature}"
+    assert _verify_hs256(forged, settings.SECRET_KEY) is None
+    with pytest.raises(jwt.InvalidTokenError):
+        _decode_token(forged)
+
+
+def test_verify_hs256_rejects_wrong_alg_header():
+    """A correctly signed body with a non-HS256 header is not accepted."""
+    _, payload, signature = create_access_token("42").split(".")
+    for alg in ("none", "HS384", "RS256"):
+        forged_header = _b64url(json.dumps({"alg": alg, "typ": "JWT"}).encode())
+        # Re-sign over the swapped header so only the alg check can reject it
+        forged_sig = _b64url(
+            hmac.new(
+                settings.SECRET_KEY.encode(),
+                f"{forged_header}.{payload}".encode(),
+                hashlib.sha256,
+            ).digest()
+        )
+        assert _verify_hs256(f"{forged_header}.{payload}.{forged_sig}", settings.SECRET_KEY) is None
+
+
+def test_verify_hs256_malformed_token():
+    """Garbage tokens return None instead of raising."""
+    assert _verify_hs256("not-a-jwt", settings.SECRET_KEY) is None
+    assert _verify_hs256("a.b", settings.SECRET_KEY) is None
+    assert _verify_hs256("a.b.c.d", settings.SECRET_KEY) is None
+
+
+def test_expired_token_raises():
+    """Expired tokens raise through both the fast path and _decode_token."""
+    token = create_access_token("42", expires_delta=timedelta(minutes=-5))
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _verify_hs256(token, settings.SECRET_KEY)
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _decode_token(token)
+
+
+def test_decode_token_roundtrip_and_cache():
+    """_decode_token returns the claims and serves repeats from its cache."""
+    token = create_access_token("42")
+    first = _decode_token(token)
+    second = _decode_token(token)
+    assert first["sub"] == "42"
+    assert second == first
+
+
+def test_protected_endpoint_rejects_forged_token(client: TestClient, test_user):
+    """End to end: a tampered bearer token is a 401, a real one is not."""
+    header, payload, _ = create_access_token(str(test_user.id)).split(".")
+    forged = f"{header}.{payload}." + _b64url(b"\x01" * 32)
+    response = client.get("/api/v1/feeds/", headers={"Authorization": f"Bearer {forged}"})
+    assert response.status_code == 401
+
+    token = create_access_token(str(test_user.id))
+    response = client.get("/api/v1/feeds/", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
@@ -0,0 +1,178 @@
+"""Test fuzzy matching and duplicate detection."""
+
+from app.models.feed import Article, Feed
+from app.services.fuzzy_matcher import FuzzyMatcher, hamming64, simhash64
+
+
+def _make_feed(db, test_user):
+    feed = Feed(
+        url="https://example.com/rss", title="Test Feed", user_id=test_user.id, is_active=True
+    )
+    db.add(feed)
+    db.commit()
+    return feed
+
+
+def _make_article(db, feed, title, link, simhash=None, content=None):
+    article = Article(
+        title=title,
+        link=link,
+        feed_id=feed.id,
+        content=content,
+        title_simhash=simhash,
+    )
+    db.add(article)
+    db.commit()
+    db.refresh(article)
+    return article
+
+
+def test_simhash64_identical_text():
+    """Identical text hashes identically."""
+    a = simhash64("Apple unveils new MacBook Pro with M4 chip")
+    b = simhash64("Apple unveils new MacBook Pro with M4 chip")
+    assert a == b
+    assert hamming64(a, b) == 0
+
+
+def test_simhash64_similar_titles_are_close():
+    """Near-duplicate titles stay within the prefilter cutoff."""
+    a = simhash64("Apple unveils new MacBook Pro with M4 chip")
+    b = simhash64("Apple unveils the new MacBook Pro with M4 chips")
+    assert hamming64(a, b) <= FuzzyMatcher._SIMHASH_MAX_HAMMING
+
+
+def test_simhash64_dissimilar_titles_are_far():
+    """Unrelated titles land well past the prefilter cutoff."""
+    a = simhash64("Apple unveils new MacBook Pro with M4 chip")
+    b = simhash64("Senate passes sweeping agricultural subsidy reform bill")
+    assert hamming64(a, b) > FuzzyMatcher._SIMHASH_MAX_HAMMING
+
+
+def test_simhash64_empty_text():
+    """Text that normalizes to nothing hashes to zero."""
+    assert simhash64("") == 0
+    assert simhash64("the a an") == 0  # stop words only
+
+
+def test_simhash64_fits_bigint():
+    """Hashes are stored two's-complement signed, inside BIGINT range."""
+    for text in ("short", "A much longer headline about several different topics", "42"):
+        value = simhash64(text)
+        assert -(2**63) <= value < 2**63
+
+
+def test_hamming64_signed_values():
+    """The distance masks back to 64 bits, so signed storage round-trips."""
+    assert hamming64(-1, 0) == 64  # -1 stores as all 64 bits set
+    assert hamming64(5, 4) == 1
+    assert hamming64(-1, -1) == 0
+
+
+def test_find_similar_headlines_matches_near_duplicate(db, test_user):
+    """A near-duplicate headline is found through the simhash prefilter."""
+    feed = _make_feed(db, test_user)
+    query = _make_article(
+        db,
+        feed,
+        "Apple unveils new MacBook Pro with M4 chip",
+        "https://example.com/1",
+        simhash=simhash64("Apple unveils new MacBook Pro with M4 chip"),
+    )
+    near = _make_article(
+        db,
+        feed,
+        "Apple unveils the new MacBook Pro with M4 chips",
+        "https://example.com/2",
+        simhash=simhash64("Apple unveils the new MacBook Pro with M4 chips"),
+    )
+    _make_article(
+        db,
+        feed,
+        "Senate passes sweeping agricultural subsidy reform bill",
+        "https://example.com/3",
+        simhash=simhash64("Senate passes sweeping agricultural subsidy reform bill"),
+    )
+
+    matcher = FuzzyMatcher(db)
+    matches = matcher.find_similar_headlines(query, threshold=0.8)
+
+    assert [a.id for a, _ in matches] == [near.id]
+    assert matches[0][1] >= 0.8
+
+
+def test_find_similar_headlines_legacy_rows_without_simhash(db, test_user):
+    """Rows predating title_simhash bypass the prefilter and still match."""
+    feed = _make_feed(db, test_user)
+    query = _make_article(
+        db,
+        feed,
+        "Apple unveils new MacBook Pro with M4 chip",
+        "https://example.com/1",
+        simhash=simhash64("Apple unveils new MacBook Pro with M4 chip"),
+    )
+    legacy = _make_article(
+        db,
+        feed,
+        "Apple unveils the new MacBook Pro with M4 chips",
+        "https://example.com/2",
+        simhash=None,
+    )
+
+    matcher = FuzzyMatcher(db)
+    matches = matcher.find_similar_headlines(query, threshold=0.8)
+
+    assert [a.id for a, _ in matches] == [legacy.id]
+
+
+def test_deduplicate_articles_marks_duplicate_pair(db, test_user):
+    """LSH blocking still pairs duplicates; distinct articles are untouched."""
+    feed = _make_feed(db, test_user)
+    title = "Apple unveils new MacBook Pro with M4 chip"
+    original = _make_article(
+        db, feed, title, "https://example.com/1", simhash=simhash64(title), content="Same body."
+    )
+    duplicate = _make_article(
+        db, feed, title, "https://example.com/2", simhash=simhash64(title), content="Same body."
+    )
+    distinct = _make_article(
+        db,
+        feed,
+        "Senate passes sweeping agricultural subsidy reform bill",
+        "https://example.com/3",
+        simhash=simhash64("Senate passes sweeping agricultural subsidy reform bill"),
+    )
+
+    matcher = FuzzyMatcher(db)
+    result = matcher.deduplicate_articles(test_user.id)
+
+    assert result["duplicate_groups"] == 1
+    assert result["articles_marked"] == 1
+    assert result["total_articles"] == 3
+
+    db.refresh(original)
+    db.refresh(duplicate)
+    db.refresh(distinct)
+    # Oldest is kept; the later copy is marked read, the distinct one is not
+    assert original.is_read is not True
+    assert duplicate.is_read is True
+    assert distinct.is_read is not True
+
+
+def test_deduplicate_articles_no_duplicates(db, test_user):
+    """A corpus without duplicates is left untouched."""
+    feed = _make_feed(db, test_user)
+    for i, title in enumerate(
+        [
+            "Apple unveils new MacBook Pro with M4 chip",
+            "Senate passes sweeping agricultural subsidy reform bill",
+            "Champions League final heads to extra time drama",
+        ]
+    ):
+        _make_article(db, feed, title, f"https://example.com/{i}", simhash=simhash64(title))
+
+    matcher = FuzzyMatcher(db)
+    result = matcher.deduplicate_articles(test_user.id)
+
+    assert result["duplicate_groups"] == 0
+    assert result["articles_marked"] == 0
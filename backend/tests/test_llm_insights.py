@@ -1,6 +1,7 @@
 """Test LLM insights service."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.orm import Session
@@ -54,7 +55,7 @@ def test_llm_service_enabled():
         mock_settings.OPENAI_API_KEY = "test-key"
         mock_settings.LLM_MODEL_OPENAI = "gpt-4-turbo-preview"
 
-        with patch("app.services.llm_insights.OpenAI"):
+        with patch("app.services.llm_insights.AsyncOpenAI"):
             service = LLMInsightService()
             assert service.enabled is True
 
@@ -67,7 +68,7 @@ def test_generate_insights_disabled(test_article):
 
         service = LLMInsightService()
         with pytest.raises(LLMFeatureDisabledError):
-            service.generate_insights(test_article)
+            asyncio.run(service.generate_insights(test_article))
 
 
 def test_generate_insights_success(test_article):
@@ -96,12 +97,12 @@ def test_generate_insights_success(test_article):
         mock_completion.choices = [MagicMock()]
         mock_completion.choices[0].message.content = str(mock_response).replace("'", '"')
 
-        with patch("app.services.llm_insights.OpenAI") as MockOpenAI:
+        with patch("app.services.llm_insights.AsyncOpenAI") as MockOpenAI:
             MockOpenAI.return_value = mock_client
-            mock_client.chat.completions.create.return_value = mock_completion
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_completion)
 
             service = LLMInsightService()
-            insights = service.generate_insights(test_article)
+            insights = asyncio.run(service.generate_insights(test_article))
 
             assert "summary" in insights
             assert "key_points" in insights
@@ -117,13 +118,13 @@ def test_generate_insights_fallback(test_article):
         mock_settings.LLM_MODEL_OPENAI = "gpt-4-turbo-preview"
 
         mock_client = MagicMock()
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
+        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
 
-        with patch("app.services.llm_insights.OpenAI") as MockOpenAI:
+        with patch("app.services.llm_insights.AsyncOpenAI") as MockOpenAI:
             MockOpenAI.return_value = mock_client
 
             service = LLMInsightService()
-            insights = service.generate_insights(test_article)
+            insights = asyncio.run(service.generate_insights(test_article))
 
             # Should return fallback insights
             assert "summary" in insights
@@ -132,6 +133,26 @@ def test_generate_insights_fallback(test_article):
             assert isinstance(insights["key_points"], list)
 
 
+def test_generate_insights_many(test_article):
+    """Test concurrent insights generation over several articles."""
+    with patch("app.services.llm_insights.settings") as mock_settings:
+        mock_settings.ENABLE_LLM_FEATURES = True
+        mock_settings.OPENAI_API_KEY = "test-key"
+        mock_settings.LLM_MODEL_OPENAI = "gpt-4-turbo-preview"
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
+
+        with patch("app.services.llm_insights.AsyncOpenAI") as MockOpenAI:
+            MockOpenAI.return_value = mock_client
+
+            service = LLMInsightService()
+            results = asyncio.run(service.generate_insights_many([test_article, test_article]))
+
+            assert len(results) == 2
+            assert all("summary" in r for r in results)
+
+
 def test_build_summary(test_article):
     """Test summary building from article."""
     with patch("app.services.llm_insights.settings") as mock_settings: